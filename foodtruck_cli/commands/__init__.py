@@ -2,14 +2,28 @@
 Food Truck CLI Commands Package
 """
 
-from .api import api_app
-from .check import check_command
-from .completion import completion_app
-from .setup import setup_app
-
-__all__ = [
-    "api_app", 
-    "check_command", 
-    "completion_app",
-    "setup_app"
-]
+from importlib import import_module
+from typing import Any
+
+# Exported name -> subpackage that defines it, imported on first access
+_LAZY_EXPORTS = {
+    "api_app": ".api",
+    "check_command": ".check",
+    "completion_app": ".completion",
+    "setup_app": ".setup",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a subcommand package only when one of its exports is requested."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(name)
+    return getattr(import_module(module_name, __name__), name)
+
+
+def __dir__() -> list[str]:
+    """List the lazy exports alongside the module's own attributes."""
+    return sorted({*globals(), *__all__})
@@ -2,18 +2,48 @@
 API command for Food Truck CLI
 """
 
+import os
+import shlex
+import shutil
 import time
-from contextlib import suppress
+from functools import cache
 from pathlib import Path
 
 from ...utils.console import print_error, print_info, print_success
-from ...utils.run_command import run_command
+from ...utils.run_command import find_executable, run_command
 from .models import ApiOperationResult, ApiStatus
 
 API_PROJECT_DIR = Path(__file__).parent.parent.parent / "foodtruck-api"
 API_PORT = 3000
+API_SERVICE_NAME = "api"
 DOCKER_COMPOSE_FILE_YML = API_PROJECT_DIR / "docker-compose.yml"
 DOCKER_COMPOSE_FILE_YAML = API_PROJECT_DIR / "docker-compose.yaml"
+STATUS_CACHE_TTL = 0.5
+# Backoff delays (seconds) used while waiting for the container to change state
+STATUS_POLL_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.5)
+
+ENV_EXAMPLE_TEMPLATE = """\
+# .env.example - Sensitive settings for foodtruck-api
+# TODO: This will be replaced by dynamic configuration from AWS S3 bucket
+# Copy this file to .env and update with actual values
+
+# Database credentials
+POSTGRES_PASSWORD=your_password_here
+POSTGRES_USER=your_username_here
+
+# JWT settings
+JWT_SECRET_KEY=your_jwt_secret_key_here
+JWT_ALGORITHM=HS256
+JWT_ACCESS_TOKEN_EXPIRE_MINUTES=30
+"""
+
+# Last (timestamp, status) pair returned by get_api_status
+_status_cache: dict[str, tuple[float, ApiStatus]] = {}
+
+
+def _docker() -> str:
+    """Absolute path of the docker CLI, resolved once per process."""
+    return find_executable("docker") or "docker"
 
 
 def _create_operation_result(
@@ -23,33 +53,55 @@ def _create_operation_result(
     return ApiOperationResult(success=success, message=message, details=details)
 
 
+def _missing_container_result() -> ApiOperationResult:
+    """Report a running API whose container ID could not be determined."""
+    print_error("Could not determine the API container ID")
+    return _create_operation_result(False, "API container not found")
+
+
+def invalidate_status_cache() -> None:
+    """Forget the cached API status so the next check queries Docker again."""
+    _status_cache.clear()
+
+
 def get_api_status() -> ApiStatus:
-    """Check if the API service is running within a Docker container and return its status."""
+    """Check if the API service is running within a Docker container and return its status.
+
+    Results are reused for STATUS_CACHE_TTL seconds so back-to-back checks
+    within one operation only query Docker once.
+    """
+    now = time.monotonic()
+    cached = _status_cache.get("status")
+    if cached is not None and now - cached[0] < STATUS_CACHE_TTL:
+        return cached[1]
+
+    status = _query_api_status()
+    _status_cache["status"] = (now, status)
+    return status
+
+
+def _query_api_status() -> ApiStatus:
+    """Query Docker for the current API container status."""
     try:
         # Check if Docker container for API is running
         result = run_command(
             [
-                "docker",
+                _docker(),
                 "ps",
                 "--filter",
                 "name=foodtruck-api",
                 "--format",
-                "{{.ID}} {{.Status}}",
+                '{{.ID}} {{.Label "com.docker.compose.service"}}',
             ]
         )
         if result.success and result.stdout:
-            lines = result.stdout.splitlines()
-            if lines:
-                container_id = lines[0].split()[0]
-                # Extract PID if possible (not directly available from docker ps, so we use inspect)
-                pid_result = run_command(
-                    ["docker", "inspect", "-f", "{{.State.Pid}}", container_id]
+            container_id = _select_api_container(result.stdout.splitlines())
+            # Other compose containers (such as the database) can match the
+            # name filter; without an api service the API is not running
+            if container_id is not None:
+                return ApiStatus(
+                    is_running=True, port=API_PORT, container_id=container_id
                 )
-                pid = None
-                if pid_result.success and pid_result.stdout:
-                    with suppress(ValueError):
-                        pid = int(pid_result.stdout.strip())
-                return ApiStatus(is_running=True, pid=pid, port=API_PORT)
 
     except Exception as e:
         print_error(f"Error checking API status: {e}")
@@ -57,13 +109,67 @@ def get_api_status() -> ApiStatus:
     return ApiStatus(is_running=False)
 
 
+def _select_api_container(lines: list[str]) -> str | None:
+    """Pick the API service container ID out of `docker ps` output lines.
+
+    Returns None when no line belongs to the api compose service.
+    """
+    for line in lines:
+        container_id, _, service = line.partition(" ")
+        if service.strip() == API_SERVICE_NAME:
+            return container_id
+    return None
+
+
+def _wait_for_api_status(is_running: bool) -> ApiStatus:
+    """Poll the API status with backoff until it reaches the expected state.
+
+    Returns as soon as the state matches, or the last status seen once the
+    delays in STATUS_POLL_DELAYS are exhausted.
+    """
+    status = get_api_status()
+    for delay in STATUS_POLL_DELAYS:
+        if status.is_running == is_running:
+            break
+        time.sleep(delay)
+        invalidate_status_cache()
+        status = get_api_status()
+    return status
+
+
+@cache
+def _api_project_exists() -> bool:
+    """Check once per process whether the API project directory exists."""
+    return API_PROJECT_DIR.exists()
+
+
+@cache
+def _resolve_compose_file() -> Path | None:
+    """Resolve the Docker Compose file of the API project, preferring .yaml.
+
+    The project directory is listed once instead of stat-ing each candidate.
+    """
+    try:
+        with os.scandir(API_PROJECT_DIR) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return None
+    for compose_file in (DOCKER_COMPOSE_FILE_YAML, DOCKER_COMPOSE_FILE_YML):
+        if compose_file.name in names:
+            return compose_file
+    return None
+
+
 def _check_and_setup_project() -> ApiOperationResult | None:
     """Check if project exists and setup if needed. Returns None if setup successful."""
-    if not API_PROJECT_DIR.exists():
+    if not _api_project_exists():
         print_info("API project directory not found, setting up the project...")
         setup_result = run_command(
             ["foodtruck", "setup", "api"], cwd=API_PROJECT_DIR.parent
         )
+        # The project tree was just created, so resolve it again next time
+        _api_project_exists.cache_clear()
+        _resolve_compose_file.cache_clear()
         if not setup_result.success:
             return _create_operation_result(
                 False, "Failed to setup API project", setup_result.stderr
@@ -74,14 +180,9 @@ def _check_and_setup_project() -> ApiOperationResult | None:
 
 def _check_docker_compose_file() -> ApiOperationResult | None:
     """Check if Docker Compose file exists. Returns None if file exists."""
-    docker_compose_file = (
-        DOCKER_COMPOSE_FILE_YAML
-        if DOCKER_COMPOSE_FILE_YAML.exists()
-        else DOCKER_COMPOSE_FILE_YML
-    )
-    if not docker_compose_file.exists():
+    if _resolve_compose_file() is None:
         return _create_operation_result(
-            False, "Docker Compose file not found", str(docker_compose_file)
+            False, "Docker Compose file not found", str(DOCKER_COMPOSE_FILE_YML)
         )
     return None
 
@@ -98,43 +199,15 @@ def _create_default_env_file() -> ApiOperationResult | None:
         try:
             # TODO: In the future, this will be replaced by fetching environment variables
             # from an AWS S3 bucket or similar service for dynamic configuration management
-            if env_example_file.exists():
-                # Copy from .env.example if it exists
-                with (
-                    env_example_file.open("r", encoding="utf-8") as src,
-                    env_file.open("w", encoding="utf-8") as dst,
-                ):
-                    dst.write(src.read())
-                print_success(
-                    "Default .env file created from .env.example. Please update it with actual values if needed."
-                )
-            else:
+            if not env_example_file.exists():
                 # Create .env.example with only sensitive settings
-                with env_example_file.open("w", encoding="utf-8") as f:
-                    f.write("# .env.example - Sensitive settings for foodtruck-api\n")
-                    f.write(
-                        "# TODO: This will be replaced by dynamic configuration from AWS S3 bucket\n"
-                    )
-                    f.write(
-                        "# Copy this file to .env and update with actual values\n\n"
-                    )
-                    f.write("# Database credentials\n")
-                    f.write("POSTGRES_PASSWORD=your_password_here\n")
-                    f.write("POSTGRES_USER=your_username_here\n\n")
-                    f.write("# JWT settings\n")
-                    f.write("JWT_SECRET_KEY=your_jwt_secret_key_here\n")
-                    f.write("JWT_ALGORITHM=HS256\n")
-                    f.write("JWT_ACCESS_TOKEN_EXPIRE_MINUTES=30\n")
-
-                # Copy the example to create the actual .env file
-                with (
-                    env_example_file.open("r", encoding="utf-8") as src,
-                    env_file.open("w", encoding="utf-8") as dst,
-                ):
-                    dst.write(src.read())
-                print_success(
-                    "Default .env file created from .env.example. Please update it with actual values if needed."
-                )
+                env_example_file.write_text(ENV_EXAMPLE_TEMPLATE, encoding="utf-8")
+
+            # Copy the example to create the actual .env file
+            shutil.copyfile(env_example_file, env_file)
+            print_success(
+                "Default .env file created from .env.example. Please update it with actual values if needed."
+            )
         except Exception as e:
             return _create_operation_result(
                 False, "Failed to create default .env file", str(e)
@@ -145,23 +218,21 @@ def _create_default_env_file() -> ApiOperationResult | None:
 def _start_docker_compose(build: bool) -> ApiOperationResult:
     """Start Docker Compose service. Returns operation result."""
     print_info("Starting API service using Docker Compose...")
-    command = ["docker", "compose", "up", "-d"]
+    command = [_docker(), "compose", "up", "-d"]
     if build:
         command.append("--build")
     start_result = run_command(command, cwd=API_PROJECT_DIR)
+    invalidate_status_cache()
     if not start_result.success:
         return _create_operation_result(
             False, "Failed to start API service", start_result.stderr
         )
 
-    # Wait a few seconds to confirm it started
-    time.sleep(3)
-    status = get_api_status()
+    # Wait until the container reports running, or give up after the backoff
+    status = _wait_for_api_status(is_running=True)
     success = status.is_running
     if status.is_running:
-        message = f"API service started successfully on port {status.port}" + (
-            f" with PID {status.pid}" if status.pid else ""
-        )
+        message = f"API service started successfully on port {status.port}"
         error_msg = ""
     else:
         message = "API service failed to start"
@@ -178,9 +249,7 @@ def start_api_service(build: bool = False) -> ApiOperationResult:
     status = get_api_status()
     if status.is_running:
         return _create_operation_result(
-            True,
-            f"API service already running on port {status.port}"
-            + (f" with PID {status.pid}" if status.pid else ""),
+            True, f"API service already running on port {status.port}"
         )
 
     # Check and setup project if needed
@@ -215,16 +284,16 @@ def stop_api_service() -> ApiOperationResult:
 
     try:
         print_info("Stopping API service...")
-        stop_result = run_command(["docker", "compose", "down"], cwd=API_PROJECT_DIR)
+        stop_result = run_command([_docker(), "compose", "down"], cwd=API_PROJECT_DIR)
+        invalidate_status_cache()
 
         if not stop_result.success:
             return _create_operation_result(
                 False, "Failed to stop API service", stop_result.stderr
             )
 
-        # Wait a moment to ensure process terminates
-        time.sleep(1)
-        updated_status = get_api_status()
+        # Wait until the container is gone, or give up after the backoff
+        updated_status = _wait_for_api_status(is_running=False)
         if not updated_status.is_running:
             return _create_operation_result(True, "API service stopped successfully")
         return _create_operation_result(
@@ -245,8 +314,6 @@ def restart_api_service() -> ApiOperationResult:
     if not stop_result.success:
         return stop_result
 
-    # Wait briefly to ensure the port is released
-    time.sleep(2)
     start_result = start_api_service()
     if not start_result.success:
         return start_result
@@ -264,19 +331,31 @@ def get_api_logs(lines: int = 50, follow: bool = False) -> ApiOperationResult:
     status = get_api_status()
     if not status.is_running:
         return _create_operation_result(False, "API service is not running")
+    if status.container_id is None:
+        return _missing_container_result()
 
     try:
-        # Use docker compose logs to get the last N lines
-        command = ["docker", "compose", "logs", f"--tail={lines}"]
+        # Read the container logs directly, skipping the docker compose CLI
+        command = [_docker(), "logs", f"--tail={lines}"]
         if follow:
             command.append("-f")
-        result = run_command(command, cwd=API_PROJECT_DIR)
+        command.append(status.container_id)
+        # Let docker write straight to the terminal instead of buffering the
+        # whole log; following has no natural end, so it gets no timeout
+        result = run_command(
+            command, timeout=None if follow else 300, capture_output=False
+        )
         if result.success:
-            return _create_operation_result(
-                True, f"Last {lines} lines of API logs", result.stdout
+            message = (
+                "Finished following API logs"
+                if follow
+                else f"Displayed last {lines} lines of API logs"
             )
+            return _create_operation_result(True, message)
         return _create_operation_result(False, "Failed to retrieve logs", result.stderr)
 
+    except KeyboardInterrupt:
+        return _create_operation_result(True, "Stopped following API logs")
     except Exception as e:
         return _create_operation_result(
             False, "Unexpected error retrieving API logs", str(e)
@@ -288,12 +367,12 @@ def exec_api_command(command: list[str]) -> ApiOperationResult:
     status = get_api_status()
     if not status.is_running:
         return _create_operation_result(False, "API service is not running")
+    if status.container_id is None:
+        return _missing_container_result()
 
     try:
         print_info(f"Executing command in API container: {' '.join(command)}")
-        result = run_command(
-            ["docker", "compose", "exec", "api", *command], cwd=API_PROJECT_DIR
-        )
+        result = run_command([_docker(), "exec", status.container_id, *command])
         if result.success:
             return _create_operation_result(
                 True, "Command executed successfully", result.stdout
@@ -308,27 +387,52 @@ def exec_api_command(command: list[str]) -> ApiOperationResult:
         )
 
 
-def run_migration() -> ApiOperationResult:
-    """Execute database migrations within the API Docker container using Alembic."""
+def exec_api_batch(commands: list[list[str]]) -> ApiOperationResult:
+    """Execute several commands within the running API container in one call.
+
+    The commands are chained with ``&&`` inside a single ``sh -c`` so the batch
+    pays the docker exec startup once and stops at the first failing command.
+
+    Args:
+        commands: Commands to run in order, each given as an argument list
+    """
     status = get_api_status()
     if not status.is_running:
         return _create_operation_result(False, "API service is not running")
+    if status.container_id is None:
+        return _missing_container_result()
 
+    script = " && ".join(shlex.join(command) for command in commands)
     try:
-        print_info("Running database migrations with Alembic...")
         result = run_command(
-            ["docker", "compose", "exec", "api", "alembic", "upgrade", "head"],
-            cwd=API_PROJECT_DIR,
+            [_docker(), "exec", status.container_id, "sh", "-c", script]
         )
         if result.success:
             return _create_operation_result(
-                True, "Database migrations completed successfully", result.stdout
+                True, "Commands executed successfully", result.stdout
             )
         return _create_operation_result(
-            False, "Failed to run database migrations", result.stderr
+            False, "Failed to execute commands", result.stderr
         )
 
     except Exception as e:
         return _create_operation_result(
-            False, "Unexpected error running database migrations", str(e)
+            False, "Unexpected error executing commands in API container", str(e)
         )
+
+
+def run_migration() -> ApiOperationResult:
+    """Execute database migrations within the API Docker container using Alembic."""
+    status = get_api_status()
+    if not status.is_running:
+        return _create_operation_result(False, "API service is not running")
+
+    print_info("Running database migrations with Alembic...")
+    result = exec_api_batch([["alembic", "upgrade", "head"]])
+    if result.success:
+        return _create_operation_result(
+            True, "Database migrations completed successfully", result.details
+        )
+    return _create_operation_result(
+        False, "Failed to run database migrations", result.details
+    )
@@ -100,8 +100,7 @@ def api_status_command() -> None:
     print_info("Checking API service status...")
     status = get_api_status()
     if status.is_running:
-        pid_text = f" with PID {status.pid}" if status.pid is not None else ""
-        print_success(f"API service is running on port {status.port}{pid_text}")
+        print_success(f"API service is running on port {status.port}")
     else:
         print_warning("API service is not running")
         print_info("Start it with: foodtruck api start")
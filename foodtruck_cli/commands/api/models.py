@@ -1,23 +1,31 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 
-class ApiStatus(BaseModel):
-    """Status of the API service."""
+@dataclass(slots=True, frozen=True)
+class ApiStatus:
+    """Status of the API service.
 
-    is_running: bool = Field(description="Whether the API service is currently running")
-    pid: int | None = Field(
-        default=None, description="Process ID of the running API service"
-    )
-    port: int | None = Field(
-        default=None, description="Port on which the API service is running"
-    )
+    Attributes:
+        is_running: Whether the API service is currently running
+        port: Port on which the API service is running
+        container_id: ID of the running API service container
+    """
 
+    is_running: bool
+    port: int | None = None
+    container_id: str | None = None
 
-class ApiOperationResult(BaseModel):
-    """Result of an API operation."""
 
-    success: bool = Field(description="Whether the operation was successful")
-    message: str = Field(description="Result message")
-    details: str = Field(
-        default="", description="Additional details or error information"
-    )
+@dataclass(slots=True, frozen=True)
+class ApiOperationResult:
+    """Result of an API operation.
+
+    Attributes:
+        success: Whether the operation was successful
+        message: Result message
+        details: Additional details or error information
+    """
+
+    success: bool
+    message: str
+    details: str = ""
@@ -2,7 +2,8 @@
 Food Truck CLI Check Commands Package
 """
 
-from .app import check_app
+from typing import Any
+
 from .command import check_dependencies_command
 
 # Legacy compatibility
@@ -13,3 +14,12 @@ __all__ = [
     "check_command",
     "check_dependencies_command"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Build the cyclopts check app only when it is actually requested."""
+    if name == "check_app":
+        from .app import check_app
+
+        return check_app
+    raise AttributeError(name)
@@ -10,9 +10,13 @@ check_app = App(name="check", help="Check command implementation.")
 
 # Since check is a simple command, we can make it the default command
 @check_app.default
-def check() -> None:
-    """Check all required dependencies."""
-    check_dependencies_command()
+def check(refresh: bool = False) -> None:
+    """Check all required dependencies.
+
+    Args:
+        refresh: Ignore cached results and re-run every check
+    """
+    check_dependencies_command(refresh)
 
 
 def check_command() -> None:
@@ -1,84 +1,187 @@
 """Core dependency checking logic for Food Truck CLI."""
 
+import asyncio
+import json
+import re
 import sys
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
 
-from ...utils.run_command import run_command
-from .models import CheckResult, DependencyStatus
+from ...utils.run_command import find_executable, run_async, run_command_async
+from .models import CheckResult, DependencyStatus, DependencyType
+
+CACHE_FILE = Path.home() / ".cache" / "foodtruck" / "check.json"
+CACHE_TTL = 24 * 60 * 60
+
+# Matches docker's stderr when the CLI is installed but the daemon is unreachable
+_DAEMON_DOWN_RE = re.compile(r"cannot connect|daemon", re.IGNORECASE)
 
 
 def check_python_version() -> DependencyStatus:
-    """Check if Python 3.13 is available."""
-    result = run_command([sys.executable, "--version"], timeout=30)
+    """Check if the running interpreter is Python 3.13."""
+    version = sys.version_info
+    found = f"Python {version.major}.{version.minor}.{version.micro}"
 
-    if not result.success:
-        return DependencyStatus(
-            False, f"Python not found or not executable: {result.stderr}"
-        )
+    if (version.major, version.minor) == (3, 13):
+        return DependencyStatus(True, found)
+    return DependencyStatus(False, f"Found {found}, but Python 3.13 is required")
 
-    # Check if it's Python 3.13
-    if "Python 3.13" in result.stdout:
-        return DependencyStatus(True, result.stdout)
-    return DependencyStatus(
-        False, f"Found {result.stdout}, but Python 3.13 is required"
-    )
 
+def _which_or_missing(executable: str, label: str) -> str | DependencyStatus:
+    """Resolve an executable on PATH, or return a failed status if it is missing.
+
+    Answering "is it installed?" this way needs no subprocess, and callers run
+    the resolved absolute path so subprocess skips its own PATH search.
+    """
+    tool_path = find_executable(executable)
+    if tool_path is None:
+        return DependencyStatus(False, f"{label} not installed")
+    return tool_path
 
-def check_uv() -> DependencyStatus:
+
+async def check_uv() -> DependencyStatus:
     """Check if UV is installed and working."""
-    result = run_command(["uv", "--version"], timeout=30)
+    uv = _which_or_missing("uv", "UV")
+    if isinstance(uv, DependencyStatus):
+        return uv
 
+    result = await run_command_async([uv, "--version"], timeout=30)
     if not result.success:
-        if "not found" in result.stderr:
-            return DependencyStatus(False, "UV not installed")
         return DependencyStatus(False, f"UV error: {result.stderr}")
 
     return DependencyStatus(True, result.stdout)
 
 
-def check_git() -> DependencyStatus:
+async def check_git() -> DependencyStatus:
     """Check if Git is installed and working."""
-    result = run_command(["git", "--version"], timeout=30)
+    git = _which_or_missing("git", "Git")
+    if isinstance(git, DependencyStatus):
+        return git
 
+    result = await run_command_async([git, "--version"], timeout=30)
     if not result.success:
-        if "not found" in result.stderr:
-            return DependencyStatus(False, "Git not installed")
         return DependencyStatus(False, f"Git error: {result.stderr}")
 
     return DependencyStatus(True, result.stdout)
 
 
-def check_docker() -> DependencyStatus:
-    """Check if Docker is installed and working."""
-    result = run_command(["docker", "--version"], timeout=30)
+async def check_docker() -> DependencyStatus:
+    """Check if Docker is installed and its daemon is running.
+
+    A single ``docker info`` call reports the server version, or fails with a
+    connection error when the daemon is down.
+    """
+    docker = _which_or_missing("docker", "Docker")
+    if isinstance(docker, DependencyStatus):
+        return docker
 
+    result = await run_command_async(
+        [docker, "info", "--format", "{{.ServerVersion}}"], timeout=30
+    )
     if not result.success:
-        if "not found" in result.stderr:
-            return DependencyStatus(False, "Docker not installed")
+        if _DAEMON_DOWN_RE.search(result.stderr):
+            return DependencyStatus(False, "Docker installed but daemon not running")
         return DependencyStatus(False, f"Docker error: {result.stderr}")
 
-    return DependencyStatus(True, result.stdout)
-
+    return DependencyStatus(
+        True, f"Docker version {result.stdout}, daemon is running"
+    )
 
-def check_docker_daemon() -> DependencyStatus:
-    """Check if Docker daemon is running."""
-    result = run_command(["docker", "info"], timeout=30)
 
-    if not result.success:
-        if "Cannot connect" in result.stderr or "daemon" in result.stderr.lower():
-            return DependencyStatus(False, "Docker daemon is not running")
-        return DependencyStatus(False, f"Docker daemon error: {result.stderr}")
+def _load_cache() -> dict[str, dict[str, Any]]:
+    """Load cached dependency check results, or an empty cache if unavailable."""
+    try:
+        with CACHE_FILE.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache: dict[str, dict[str, Any]]) -> None:
+    """Persist dependency check results; failures only cost the next run time."""
+    with suppress(OSError):
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+
+
+def _tool_fingerprint(executable: str) -> tuple[str | None, float | None]:
+    """Return the resolved path and mtime of an executable, if it is installed."""
+    tool_path = find_executable(executable)
+    if tool_path is None:
+        return None, None
+    try:
+        return tool_path, Path(tool_path).stat().st_mtime
+    except OSError:
+        return tool_path, None
+
+
+async def _cached_check(
+    cache: dict[str, dict[str, Any]],
+    name: str,
+    executable: str,
+    check: Callable[[], Awaitable[DependencyStatus]],
+    refresh: bool,
+) -> DependencyStatus:
+    """Run a version check, reusing a fresh cached success for the same binary.
+
+    A cached entry is only trusted while the executable still resolves to the
+    same path with the same mtime, so upgrades and reinstalls are re-checked.
+    """
+    tool_path, tool_mtime = _tool_fingerprint(executable)
+    entry = cache.get(name)
+    if (
+        not refresh
+        and entry is not None
+        and entry.get("tool_path") == tool_path
+        and entry.get("tool_mtime") == tool_mtime
+        and time.time() - entry.get("ts", 0) < CACHE_TTL
+    ):
+        return DependencyStatus(entry["is_ok"], entry["message"])
+
+    status = await check()
+    if status.is_ok:
+        cache[name] = {
+            "is_ok": status.is_ok,
+            "message": status.message,
+            "ts": time.time(),
+            "tool_path": tool_path,
+            "tool_mtime": tool_mtime,
+        }
+    else:
+        cache.pop(name, None)
+    return status
+
+
+async def _run_tool_checks(
+    cache: dict[str, dict[str, Any]], refresh: bool
+) -> tuple[DependencyStatus, DependencyStatus, DependencyStatus]:
+    """Run the subprocess-backed checks concurrently on one event loop."""
+    uv, git, docker = await asyncio.gather(
+        _cached_check(cache, DependencyType.UV.value, "uv", check_uv, refresh),
+        _cached_check(cache, DependencyType.GIT.value, "git", check_git, refresh),
+        check_docker(),
+    )
+    return uv, git, docker
 
-    return DependencyStatus(True, "Docker daemon is running")
 
+def perform_dependency_checks(refresh: bool = False) -> CheckResult:
+    """Perform all dependency checks and return results.
 
-def perform_dependency_checks() -> CheckResult:
-    """Perform all dependency checks and return results."""
-    dependency_results = {
-        "Python 3.13": check_python_version(),
-        "UV": check_uv(),
-        "Git": check_git(),
-        "Docker": check_docker(),
-        "Docker Daemon": check_docker_daemon(),
-    }
+    The subprocess-backed checks run concurrently, so the total time is
+    roughly that of the slowest one. Successful tool version checks are cached
+    on disk for CACHE_TTL seconds; the Docker check always runs since the
+    daemon state changes independently of the installed tools.
 
-    return CheckResult.from_results(dependency_results)
+    Args:
+        refresh: If True, ignore cached results and re-run every check
+    """
+    cache = _load_cache()
+    check_result = CheckResult(
+        check_python_version(), *run_async(_run_tool_checks(cache, refresh))
+    )
+    _save_cache(cache)
+    return check_result
@@ -3,8 +3,9 @@
 import sys
 
 from ...utils.console import (
-    print_error,
+    MessageType,
     print_info,
+    print_messages,
     print_newline,
     print_separator,
     print_success,
@@ -15,35 +16,50 @@ from .check import perform_dependency_checks
 from .models import DependencyStatus
 
 
-def print_dependency_status(name: str, status: DependencyStatus) -> None:
-    """Print the status of a dependency."""
-    if status.is_ok:
-        print_success(f"{name}: {status.message}")
-    else:
-        print_error(f"{name}: {status.message}")
+def format_dependency_status(
+    name: str, status: DependencyStatus
+) -> tuple[str, MessageType]:
+    """Format the status of a dependency as a printable message."""
+    msg_type = MessageType.SUCCESS if status.is_ok else MessageType.ERROR
+    return f"{name}: {status.message}", msg_type
 
 
 def print_installation_guides() -> None:
     """Print installation guides for missing dependencies."""
-    print_info("Installation guides:")
-    print_info("  • Python 3.13: https://www.python.org/downloads/")
-    print_info("  • UV: https://docs.astral.sh/uv/getting-started/installation/")
-    print_info("  • Git: https://git-scm.com/downloads")
-    print_info("  • Docker: https://docs.docker.com/get-docker/")
+    print_messages(
+        [
+            ("Installation guides:", MessageType.INFO),
+            ("  • Python 3.13: https://www.python.org/downloads/", MessageType.INFO),
+            (
+                "  • UV: https://docs.astral.sh/uv/getting-started/installation/",
+                MessageType.INFO,
+            ),
+            ("  • Git: https://git-scm.com/downloads", MessageType.INFO),
+            ("  • Docker: https://docs.docker.com/get-docker/", MessageType.INFO),
+        ]
+    )
+
 
+def check_dependencies_command(refresh: bool = False) -> None:
+    """Main check dependencies command implementation.
 
-def check_dependencies_command() -> None:
-    """Main check dependencies command implementation."""
+    Args:
+        refresh: Ignore cached results and re-run every check
+    """
     print_title("🔍 Checking Dependencies")
     print_info("Verifying all required tools are installed and working...")
     print_newline()
 
     # Perform dependency checks
-    check_result = perform_dependency_checks()
+    check_result = perform_dependency_checks(refresh=refresh)
 
     # Print individual dependency statuses
-    for name, status in check_result.results.items():
-        print_dependency_status(name, status)
+    print_messages(
+        [
+            format_dependency_status(name, status)
+            for name, status in check_result.iter_labeled()
+        ]
+    )
 
     print_newline()
     print_separator()
@@ -1,5 +1,6 @@
 """Data models for check command."""
 
+from collections.abc import Iterator
 from enum import Enum
 from typing import NamedTuple
 
@@ -18,17 +19,25 @@ class DependencyType(Enum):
     UV = "UV"
     GIT = "Git"
     DOCKER = "Docker"
-    DOCKER_DAEMON = "Docker Daemon"
 
 
 class CheckResult(NamedTuple):
-    """Result of all dependency checks."""
+    """Result of all dependency checks, one field per DependencyType."""
 
-    results: dict[str, DependencyStatus]
-    all_ok: bool
+    python: DependencyStatus
+    uv: DependencyStatus
+    git: DependencyStatus
+    docker: DependencyStatus
 
-    @classmethod
-    def from_results(cls, results: dict[str, DependencyStatus]) -> "CheckResult":
-        """Create CheckResult from dependency results."""
-        all_ok = all(status.is_ok for status in results.values())
-        return cls(results=results, all_ok=all_ok)
+    @property
+    def all_ok(self) -> bool:
+        """Whether every dependency check passed."""
+        return all(status.is_ok for status in self)
+
+    def iter_labeled(self) -> Iterator[tuple[str, DependencyStatus]]:
+        """Iterate over (display name, status) pairs in check order."""
+        return zip(_LABELS, self, strict=True)
+
+
+# Display names matching the CheckResult field order
+_LABELS = tuple(dependency.value for dependency in DependencyType)
@@ -2,9 +2,18 @@
 Food Truck CLI Completion Commands Package
 """
 
-from .app import completion_app, completion_command
+from typing import Any
+
+from .app import completion_command, get_completion_app
 
 __all__ = [
     "completion_app",
     "completion_command"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Build the cyclopts completion app only when it is actually requested."""
+    if name == "completion_app":
+        return get_completion_app()
+    raise AttributeError(name)
@@ -1,39 +1,54 @@
 """Completion command app configuration."""
 
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from cyclopts import App
 
-from .command import (
-    install_completion_command,
-    manual_completion_command,
-    refresh_completion_command,
-)
 
-# Create the completion app
-completion_app = App(
-    name="completion", help="Generate shell completion scripts using carapace-bin"
-)
+@cache
+def get_completion_app() -> App:
+    """Create the completion app and register its subcommands on first use.
 
+    The completion implementation is only imported once a subcommand runs, so
+    building the app for other commands stays cheap.
+    """
+    completion_app = App(
+        name="completion", help="Generate shell completion scripts using carapace-bin"
+    )
 
-@completion_app.command
-def install(shell: str = "", output: Path | None = None):
-    """Install shell completion."""
-    install_completion_command(shell, output)
+    @completion_app.command
+    def install(shell: str = "", output: Path | None = None):
+        """Install shell completion."""
+        from .command import install_completion_command
 
+        install_completion_command(shell, output)
 
-@completion_app.command
-def refresh(shell: str = ""):
-    """Refresh shell completion."""
-    refresh_completion_command(shell)
+    @completion_app.command
+    def refresh(shell: str = ""):
+        """Refresh shell completion."""
+        from .command import refresh_completion_command
 
+        refresh_completion_command(shell)
 
-@completion_app.command
-def manual(shell: str = "", output: Path | None = None):
-    """Show manual completion instructions."""
-    manual_completion_command(shell, output)
+    @completion_app.command
+    def manual(shell: str = "", output: Path | None = None):
+        """Show manual completion instructions."""
+        from .command import manual_completion_command
+
+        manual_completion_command(shell, output)
+
+    return completion_app
 
 
 def completion_command() -> None:
     """Generate shell completion scripts using carapace-bin (legacy compatibility)."""
-    completion_app()
+    get_completion_app()()
+
+
+def __getattr__(name: str) -> Any:
+    """Build the cyclopts completion app only when it is actually requested."""
+    if name == "completion_app":
+        return get_completion_app()
+    raise AttributeError(name)
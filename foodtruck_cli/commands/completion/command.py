@@ -1,7 +1,11 @@
 """Completion command implementation functions."""
 
+import re
+import shutil
 import sys
+import tempfile
 from pathlib import Path
+from typing import TextIO
 
 from ...utils.console import (
     print_error,
@@ -10,25 +14,79 @@ from ...utils.console import (
     print_warning,
 )
 from .completion import (
+    HASH_HEADER_PREFIX,
+    SPEC_FILE_NAME,
+    content_digest,
     create_completion_setup,
     get_carapace_config_dir,
+    get_home_dir,
+    has_content_hash,
     save_carapace_spec,
 )
 from .models import CompletionResult, SupportedShell
 
+# Both must appear in a shell config for completion to count as configured
+COMPLETION_TOKENS = ("carapace", "foodtruck")
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+# Lines mentioning carapace in any case belong to a completion block
+_CARAPACE_RE = re.compile("carapace", re.IGNORECASE)
+
+# check_existing_completion results keyed by config and spec file stats
+_CHECK_CACHE: dict[tuple[str, int, int, int], bool] = {}
+
+
+def _contains_tokens(f: TextIO, tokens: tuple[str, ...] = COMPLETION_TOKENS) -> bool:
+    """Scan an open text file in chunks until every token has been seen.
+
+    A short tail of each chunk is carried over so tokens split across chunk
+    boundaries still match, and large rc files are never read whole.
+    """
+    pending = set(tokens)
+    overlap = max(map(len, tokens)) - 1
+    tail = ""
+    while chunk := f.read(_SCAN_CHUNK_SIZE):
+        window = tail + chunk
+        pending = {token for token in pending if token not in window}
+        if not pending:
+            return True
+        tail = window[-overlap:] if overlap else ""
+    return False
+
 
 def check_existing_completion(setup):
-    """Check if completion is already installed."""
-    if not setup.config_file.exists() or not setup.spec_path.exists():
+    """Check if completion is already installed.
+
+    Results are remembered per config path, size and modification time, and
+    per spec modification time, so the config is only rescanned after a change.
+    """
+    try:
+        config_stat = setup.config_file.stat()
+        spec_stat = setup.spec_path.stat()
+    except OSError:
         return False
 
+    key = (
+        str(setup.config_file),
+        config_stat.st_mtime_ns,
+        config_stat.st_size,
+        spec_stat.st_mtime_ns,
+    )
+    installed = _CHECK_CACHE.get(key)
+    if installed is not None:
+        return installed
+
     try:
-        with setup.config_file.open("r", encoding="utf-8") as f:
-            content = f.read()
-            return "carapace" in content and "foodtruck" in content
+        with setup.config_file.open(
+            "r", encoding="utf-8", buffering=_SCAN_CHUNK_SIZE
+        ) as f:
+            installed = _contains_tokens(f)
     except Exception:
         return False
 
+    _CHECK_CACHE[key] = installed
+    return installed
+
 
 def auto_configure_shell(setup):
     """Automatically configure the shell for carapace completion."""
@@ -36,36 +94,35 @@ def auto_configure_shell(setup):
         config_file = setup.config_file
         setup_commands = setup.setup_commands
 
-        # Check if configuration already exists
-        if config_file.exists():
-            with config_file.open("r", encoding="utf-8") as f:
-                content = f.read()
-                if "carapace" in content and "foodtruck" in content:
-                    return CompletionResult(
-                        success=True,
-                        message="Configuration already exists",
-                        details=str(config_file),
-                    )
-
         # Create parent directories if needed
         config_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Add configuration to the file
-        with config_file.open("a", encoding="utf-8") as f:
-            f.write("\n# Food Truck CLI completion (auto-configured)\n")
-            f.write(setup_commands)
-            f.write("\n")
+        # Check for existing configuration and append to the file in one open;
+        # in "a+" mode writes always go to the end regardless of the read position
+        with config_file.open("a+", encoding="utf-8", buffering=_SCAN_CHUNK_SIZE) as f:
+            f.seek(0)
+            if _contains_tokens(f):
+                return CompletionResult(
+                    success=True,
+                    message="Configuration already exists",
+                    details=str(config_file),
+                )
+
+            # Add configuration to the file
+            f.write(
+                f"\n# Food Truck CLI completion (auto-configured)\n{setup_commands}\n"
+            )
 
         # For CMD, also create a batch file that can be sourced
         if setup.shell == SupportedShell.CMD:
-            batch_file = Path.home() / "foodtruck_completion.bat"
-            with batch_file.open("w", encoding="utf-8") as f:
-                f.write("@echo off\n")
-                f.write("REM Food Truck CLI completion for CMD\n")
-                f.write(f"set PATH={setup.carapace_path.parent};%PATH%\n")
-                f.write(
-                    "REM Note: CMD completion is limited. Consider using PowerShell.\n"
-                )
+            batch_file = get_home_dir() / "foodtruck_completion.bat"
+            batch_file.write_text(
+                "@echo off\n"
+                "REM Food Truck CLI completion for CMD\n"
+                f"set PATH={setup.carapace_path.parent};%PATH%\n"
+                "REM Note: CMD completion is limited. Consider using PowerShell.\n",
+                encoding="utf-8",
+            )
 
         return CompletionResult(
             success=True,
@@ -96,18 +153,17 @@ def auto_configure_shell(setup):
 def remove_carapace_spec():
     """Remove the existing carapace spec file."""
     config_dir = get_carapace_config_dir()
-    spec_path = config_dir / "foodtruck.yaml"
-
-    if not spec_path.exists():
-        return CompletionResult(
-            success=True, message="No existing spec file found", details=""
-        )
+    spec_path = config_dir / SPEC_FILE_NAME
 
     try:
         spec_path.unlink()
         return CompletionResult(
             success=True, message="Removed existing spec file", details=str(spec_path)
         )
+    except FileNotFoundError:
+        return CompletionResult(
+            success=True, message="No existing spec file found", details=""
+        )
     except PermissionError as e:
         return CompletionResult(
             success=False,
@@ -126,53 +182,65 @@ def remove_carapace_spec():
         )
 
 
+def _filter_completion_block(src: TextIO, dst: TextIO) -> None:
+    """Copy lines from src to dst, dropping carapace completion blocks."""
+    in_carapace_block = False
+
+    for line in src:
+        # One case-insensitive search per line; also covers "Carapace-bin ..." lines
+        has_carapace = _CARAPACE_RE.search(line) is not None
+
+        # Check if this line starts a carapace block
+        if has_carapace or "Food Truck CLI completion" in line:
+            in_carapace_block = True
+            continue
+
+        # Skip lines that are part of the carapace block
+        if in_carapace_block:
+            if not line.strip() or (line.startswith("#") and not has_carapace):
+                # End of carapace block
+                in_carapace_block = False
+            else:
+                # Still in carapace block, skip this line
+                continue
+
+        # Keep non-carapace lines
+        dst.write(line)
+
+
 def remove_shell_config(setup):
     """Remove carapace configuration from shell config file."""
     try:
         config_file = setup.config_file
 
-        if not config_file.exists():
+        # Stream the filtered lines into a temporary sibling and swap it in, so
+        # the config is replaced atomically and never held in memory whole.
+        # Resolving first keeps symlinked dotfiles pointing at the real file.
+        target = config_file.resolve()
+        try:
+            src = target.open("r", encoding="utf-8", buffering=_SCAN_CHUNK_SIZE)
+        except FileNotFoundError:
             return CompletionResult(
                 success=True,
                 message="Shell config file not found",
                 details=str(config_file),
             )
 
-        # Read the file and remove carapace-related lines
-        with config_file.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Filter out carapace and foodtruck completion lines
-        filtered_lines = []
-        in_carapace_block = False
-
-        for line in lines:
-            # Check if this line starts a carapace block
-            if (
-                "Food Truck CLI completion" in line
-                or "carapace" in line.lower()
-                or "Carapace-bin completion setup" in line
-            ):
-                in_carapace_block = True
-                continue
-
-            # Skip lines that are part of the carapace block
-            if in_carapace_block:
-                if line.strip() == "" or (
-                    line.startswith("#") and "carapace" not in line.lower()
-                ):
-                    # End of carapace block
-                    in_carapace_block = False
-                else:
-                    # Still in carapace block, skip this line
-                    continue
-
-            # Keep non-carapace lines
-            filtered_lines.append(line)
-
-        # Write back the filtered content
-        with config_file.open("w", encoding="utf-8") as f:
-            f.writelines(filtered_lines)
+        with (
+            src,
+            tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=target.parent, delete=False
+            ) as dst,
+        ):
+            tmp_path = Path(dst.name)
+            try:
+                _filter_completion_block(src, dst)
+            except BaseException:
+                dst.close()
+                tmp_path.unlink(missing_ok=True)
+                raise
+        shutil.copymode(target, tmp_path)
+        tmp_path.replace(target)
 
         return CompletionResult(
             success=True,
@@ -201,16 +269,12 @@ def remove_shell_config(setup):
 
 
 def _handle_spec_operations(config_dir):
-    """Handle common spec operations for install and refresh commands."""
+    """Remove the installed spec and save a fresh one, as refresh requires."""
     spec_result = remove_carapace_spec()
     if not spec_result.success:
         return spec_result, CompletionResult(success=False, message="", details="")
 
-    new_spec_result = save_carapace_spec(config_dir)
-    if not new_spec_result.success:
-        return spec_result, new_spec_result
-
-    return spec_result, new_spec_result
+    return spec_result, save_carapace_spec(config_dir)
 
 
 def install_completion_command(shell: str = "") -> None:
@@ -226,9 +290,10 @@ def install_completion_command(shell: str = "") -> None:
 
         print_success(f"Installing carapace completion for {setup.shell.value}...")
 
-        # Create spec in user's carapace config directory
+        # Create spec in user's carapace config directory; an installed spec
+        # that is already current is left as is (refresh forces a rewrite)
         config_dir = get_carapace_config_dir()
-        spec_result, new_spec_result = _handle_spec_operations(config_dir)
+        new_spec_result = save_carapace_spec(config_dir)
 
         if not new_spec_result.success:
             print_error(f"Failed to save spec: {new_spec_result.message}")
@@ -319,13 +384,21 @@ def manual_completion_command(shell: str = "", output: Path | None = None) -> No
         print_warning(setup.setup_commands)
 
         if output:
+            content = (
+                f"# Food Truck CLI completion for {setup.shell.value}\n"
+                "# Generated by carapace-bin\n\n"
+                f"{setup.setup_commands}\n"
+            )
+            digest = content_digest(content)
+
+            # Skip rewriting a file generated from identical content
+            if has_content_hash(output, digest):
+                print_info(f"Setup commands already up to date in: {output}")
+                return
+
             # Save the setup commands to a file
             output.parent.mkdir(parents=True, exist_ok=True)
-            with output.open("w", encoding="utf-8") as f:
-                f.write(f"# Food Truck CLI completion for {setup.shell.value}\n")
-                f.write("# Generated by carapace-bin\n\n")
-                f.write(setup.setup_commands)
-                f.write("\n")
+            output.write_bytes(f"{HASH_HEADER_PREFIX}{digest}\n{content}".encode())
             print_success(f"Setup commands saved to: {output}")
 
     except Exception as e:
@@ -1,23 +1,45 @@
 """Core completion logic for Food Truck CLI."""
 
+import hashlib
 import os
-import platform
 import shutil
+import stat
+import sys
+from functools import cache
 from pathlib import Path
 
 from .models import CompletionResult, CompletionSetup, SupportedShell
 
+# sys.platform is a constant, unlike platform.system() which calls uname()
+_IS_WINDOWS = sys.platform.startswith("win")
 
+# Directory of this module, and of the foodtruck_cli package that holds it
+_MODULE_DIR = Path(__file__).parent
+_PACKAGE_DIR = _MODULE_DIR.parent.parent
+
+# File name of the installed spec inside the carapace specs directory
+SPEC_FILE_NAME = "foodtruck.yaml"
+
+# First line of generated files, recording a hash of the content below it
+HASH_HEADER_PREFIX = "# fthash: "
+
+
+@cache
+def get_home_dir() -> Path:
+    """Get the user's home directory, looked up once per process."""
+    return Path.home()
+
+
+@cache
 def get_carapace_path() -> Path | None:
     """Get the path to the carapace executable."""
-    # Try to find carapace in the project directory first
-    project_dir = Path(__file__).parent.parent.parent
-
     # Use correct executable name for platform
-    carapace_name = "carapace.exe" if platform.system() == "Windows" else "carapace"
-    carapace_path = project_dir / "carapace-bin" / carapace_name
+    carapace_name = "carapace.exe" if _IS_WINDOWS else "carapace"
+
+    # Try to find carapace in the project directory first
+    carapace_path = _PACKAGE_DIR / "carapace-bin" / carapace_name
 
-    if carapace_path.exists() and carapace_path.is_file():
+    if carapace_path.is_file():
         return carapace_path
 
     # Try to find carapace in PATH
@@ -28,60 +50,46 @@ def get_carapace_path() -> Path | None:
     return None
 
 
+@cache
 def get_spec_file_path() -> Path:
     """Get the path to the carapace spec file."""
-    return Path(__file__).parent / "complete.yaml"
+    return _MODULE_DIR / "complete.yaml"
 
 
+@cache
 def get_carapace_config_dir() -> Path:
     """Get the appropriate carapace config directory for the platform."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         # Windows: Use APPDATA directory
-        appdata = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
-        return appdata / "carapace" / "specs"
+        appdata = os.environ.get("APPDATA")
+        appdata_dir = (
+            Path(appdata) if appdata else get_home_dir() / "AppData" / "Roaming"
+        )
+        return appdata_dir / "carapace" / "specs"
     # Unix-like: Use .config directory
-    return Path.home() / ".config" / "carapace" / "specs"
-
-
-def get_shell_config_file(shell: SupportedShell) -> Path:
-    """Get the path to the shell configuration file."""
-    home = Path.home()
-    shell_config_map = {
-        SupportedShell.BASH: home / ".bashrc",
-        SupportedShell.ZSH: home / ".zshrc",
-        SupportedShell.FISH: home / ".config" / "fish" / "config.fish",
-        SupportedShell.CMD: home / "foodtruck_completion.bat"
-    }
-
-    if shell == SupportedShell.POWERSHELL:
-        profile_path = os.environ.get("POWERSHELL_PROFILE")
-        if profile_path:
-            return Path(profile_path)
-        return home / "Documents" / "PowerShell" / "Microsoft.PowerShell_profile.ps1"
-
-    return shell_config_map.get(shell, UnsupportedShellConfigError())
+    return get_home_dir() / ".config" / "carapace" / "specs"
 
 
-def get_shell_setup_commands(shell: SupportedShell, carapace_path: Path) -> str:
-    """Get the proper setup commands for each shell based on official documentation."""
-    carapace_dir = carapace_path.parent
+# Shell config files, relative to the home directory
+_SHELL_CONFIG_PATHS = {
+    SupportedShell.BASH: Path(".bashrc"),
+    SupportedShell.ZSH: Path(".zshrc"),
+    SupportedShell.FISH: Path(".config") / "fish" / "config.fish",
+    SupportedShell.POWERSHELL: Path("Documents")
+    / "PowerShell"
+    / "Microsoft.PowerShell_profile.ps1",
+    SupportedShell.CMD: Path("foodtruck_completion.bat"),
+}
 
-    # Convert path to appropriate format for the shell
-    if platform.system() == "Windows":
-        carapace_dir_str = str(carapace_dir).replace("/", "\\")
-        carapace_path_str = str(carapace_path).replace("/", "\\")
-    else:
-        carapace_dir_str = str(carapace_dir)
-        carapace_path_str = str(carapace_path)
-
-    shell_setup_map = {
-        SupportedShell.BASH: f"""# Add carapace to PATH
-export PATH="{carapace_dir_str}:$PATH"
+# Setup command templates, formatted with the carapace directory and executable
+_SHELL_TEMPLATES = {
+    SupportedShell.BASH: """# Add carapace to PATH
+export PATH="{carapace_dir}:$PATH"
 
 # Load all carapace completions
-source <({carapace_path_str} _carapace)""",
-        SupportedShell.ZSH: f"""# Add carapace to PATH
-export PATH="{carapace_dir_str}:$PATH"
+source <({carapace_path} _carapace)""",
+    SupportedShell.ZSH: """# Add carapace to PATH
+export PATH="{carapace_dir}:$PATH"
 
 # Optional: Configure bridges
 export CARAPACE_BRIDGES='zsh,fish,bash,inshellisense'
@@ -90,17 +98,17 @@ export CARAPACE_BRIDGES='zsh,fish,bash,inshellisense'
 zstyle ':completion:*' format $'\\e[2;37mCompleting %d\\e[m'
 
 # Load all carapace completions
-source <({carapace_path_str} _carapace)""",
-        SupportedShell.FISH: f"""# Add carapace to PATH
-set -Ux PATH "{carapace_dir_str}" $PATH
+source <({carapace_path} _carapace)""",
+    SupportedShell.FISH: """# Add carapace to PATH
+set -Ux PATH "{carapace_dir}" $PATH
 
 # Optional: Configure bridges
 set -Ux CARAPACE_BRIDGES 'zsh,fish,bash,inshellisense'
 
 # Load all carapace completions
-{carapace_path_str} _carapace | source""",
-        SupportedShell.POWERSHELL: f"""# Add carapace to PATH
-$env:PATH = "{carapace_dir_str};" + $env:PATH
+{carapace_path} _carapace | source""",
+    SupportedShell.POWERSHELL: """# Add carapace to PATH
+$env:PATH = "{carapace_dir};" + $env:PATH
 
 # Optional: Configure bridges
 $env:CARAPACE_BRIDGES = 'zsh,fish,bash,inshellisense'
@@ -110,22 +118,46 @@ Set-PSReadLineOption -Colors @{{ "Selection" = "`e[7m" }}
 Set-PSReadlineKeyHandler -Key Tab -Function MenuComplete
 
 # Load all carapace completions
-{carapace_path_str} _carapace | Out-String | Invoke-Expression""",
-        SupportedShell.CMD: f"""# Add carapace to PATH
-set PATH={carapace_dir_str};%PATH%
+{carapace_path} _carapace | Out-String | Invoke-Expression""",
+    SupportedShell.CMD: """# Add carapace to PATH
+set PATH={carapace_dir};%PATH%
+
+# Note: CMD completion is limited. Consider using PowerShell for better completion support.""",
+}
 
-# Note: CMD completion is limited. Consider using PowerShell for better completion support."""
-    }
 
-    setup_command = shell_setup_map.get(shell)
-    if setup_command is None:
+@cache
+def get_shell_config_file(shell: SupportedShell) -> Path:
+    """Get the path to the shell configuration file."""
+    if shell == SupportedShell.POWERSHELL:
+        profile_path = os.environ.get("POWERSHELL_PROFILE")
+        if profile_path:
+            return Path(profile_path)
+
+    relative_path = _SHELL_CONFIG_PATHS.get(shell)
+    if relative_path is None:
+        raise UnsupportedShellConfigError
+    return get_home_dir() / relative_path
+
+
+@cache
+def get_shell_setup_commands(shell: SupportedShell, carapace_path: Path) -> str:
+    """Get the proper setup commands for each shell based on official documentation."""
+    template = _SHELL_TEMPLATES.get(shell)
+    if template is None:
         raise UnsupportedShellSetupError
-    return setup_command
+
+    # Paths already render with the platform's native separator
+    return template.format(
+        carapace_dir=os.fspath(carapace_path.parent),
+        carapace_path=os.fspath(carapace_path),
+    )
 
 
+@cache
 def detect_shell() -> SupportedShell:
     """Auto-detect the current shell."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         # Check for PowerShell first, then CMD
         if "powershell" in os.environ.get("SHELL", "").lower():
             return SupportedShell.POWERSHELL
@@ -139,21 +171,78 @@ def detect_shell() -> SupportedShell:
     return SupportedShell.BASH
 
 
+@cache
+def _read_spec_bytes(source: Path) -> bytes:
+    """Read the bundled spec once per process."""
+    return source.read_bytes()
+
+
+@cache
+def _spec_digest(source: Path) -> bytes:
+    """Hash the bundled spec once per process."""
+    return hashlib.blake2b(_read_spec_bytes(source), digest_size=16).digest()
+
+
+def _has_spec_content(source: Path, target: Path, target_size: int) -> bool:
+    """Check whether target already holds the bundled spec's exact content.
+
+    A size mismatch answers without reading the target at all.
+    """
+    if target_size != len(_read_spec_bytes(source)):
+        return False
+    try:
+        target_digest = hashlib.blake2b(target.read_bytes(), digest_size=16).digest()
+    except OSError:
+        return False
+    return target_digest == _spec_digest(source)
+
+
+def _copy_spec(source: Path, target: Path) -> None:
+    """Write a copy of the bundled spec to target.
+
+    The copy is staged next to the target and moved into place with an atomic
+    rename, so an interrupted install never leaves a partially written spec
+    behind. It is always a real copy: a link would let edits to the installed
+    spec change the packaged one, and would break when the package moves.
+    """
+    staging = target.with_name(f"{target.name}.tmp")
+    staging.write_bytes(_read_spec_bytes(source))
+    staging.replace(target)
+
+
 def save_carapace_spec(spec_dir: Path) -> CompletionResult:
     """Save the carapace spec to the appropriate directory."""
     try:
         spec_dir.mkdir(parents=True, exist_ok=True)
-        spec_path = spec_dir / "foodtruck.yaml"
+        spec_path = spec_dir / SPEC_FILE_NAME
 
         # Read the spec from the local YAML file
         source_spec = get_spec_file_path()
-        if not source_spec.exists():
+        try:
+            source_stat = source_spec.stat()
+        except FileNotFoundError:
             return CompletionResult(
                 success=False, message="Spec file not found", details=str(source_spec)
             )
 
-        # Copy the spec file to the carapace config directory
-        shutil.copy2(source_spec, spec_path)
+        # Nothing to do when the installed spec is already current
+        try:
+            spec_stat = spec_path.lstat()
+        except FileNotFoundError:
+            _copy_spec(source_spec, spec_path)
+        else:
+            if stat.S_ISLNK(spec_stat.st_mode) or os.path.samestat(
+                spec_stat, source_stat
+            ):
+                # Replace a link to the packaged spec left by older installs
+                _copy_spec(source_spec, spec_path)
+            elif spec_stat.st_mtime < source_stat.st_mtime:
+                if _has_spec_content(source_spec, spec_path, spec_stat.st_size):
+                    # Same bytes under an older timestamp (e.g. after a fresh
+                    # checkout); bump it so the mtime check short-circuits next time
+                    spec_path.touch()
+                else:
+                    _copy_spec(source_spec, spec_path)
 
         return CompletionResult(
             success=True, message="Spec file saved successfully", details=str(spec_path)
@@ -165,6 +254,24 @@ def save_carapace_spec(spec_dir: Path) -> CompletionResult:
         )
 
 
+def content_digest(content: str) -> str:
+    """Get a short, stable hash of generated file content."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def has_content_hash(path: Path, digest: str) -> bool:
+    """Check whether a generated file already carries the given content hash.
+
+    Only the header line is read, so an unchanged file is detected without
+    reading or rewriting its body.
+    """
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return f.readline().rstrip("\n") == f"{HASH_HEADER_PREFIX}{digest}"
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
 def create_completion_setup(shell: str = "") -> CompletionSetup:
     """Create a CompletionSetup configuration."""
     # Parse shell type
@@ -177,7 +284,7 @@ def create_completion_setup(shell: str = "") -> CompletionSetup:
 
     # Get paths and commands
     config_file = get_shell_config_file(shell_type)
-    spec_path = get_carapace_config_dir() / "foodtruck.yaml"
+    spec_path = get_carapace_config_dir() / SPEC_FILE_NAME
     setup_commands = get_shell_setup_commands(shell_type, carapace_path)
 
     return CompletionSetup(
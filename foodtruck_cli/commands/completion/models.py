@@ -1,12 +1,13 @@
 """Data models for completion command."""
 
-from enum import Enum
+from enum import StrEnum
+from functools import cache
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 
-class SupportedShell(Enum):
+class SupportedShell(StrEnum):
     """Supported shell types for completion."""
 
     BASH = "bash"
@@ -19,20 +20,31 @@ class SupportedShell(Enum):
         """Exception raised when an unsupported shell type is provided."""
 
         def __init__(self, shell: str):
-            super().__init__(f"Unsupported shell: {shell}")
+            super().__init__(
+                f"Unsupported shell: {shell}. Supported shells: {SUPPORTED_SHELLS_TEXT}"
+            )
 
     @classmethod
     def from_string(cls, shell: str) -> "SupportedShell":
-        """Create SupportedShell from string value."""
-        for shell_type in cls:
-            if shell_type.value == shell.lower():
-                return shell_type
-        raise cls.UnsupportedShellError(shell)
+        """Create SupportedShell from string value.
+
+        Value lookup goes through the enum's own value-to-member map, a single
+        dict access instead of a scan over the members.
+        """
+        try:
+            return cls(shell.lower())
+        except ValueError:
+            raise cls.UnsupportedShellError(shell) from None
 
     @classmethod
-    def all_shells(cls) -> list[str]:
-        """Get list of all supported shell names."""
-        return [shell.value for shell in cls]
+    @cache
+    def all_shells(cls) -> tuple[str, ...]:
+        """Get all supported shell names; members compare equal to their names."""
+        return tuple(cls)
+
+
+# Comma-separated supported shell names, joined once for error messages
+SUPPORTED_SHELLS_TEXT = ", ".join(SupportedShell.all_shells())
 
 
 class CompletionSetup(BaseModel):
@@ -2,11 +2,28 @@
 Food Truck CLI Setup Commands Package
 """
 
-from .app import setup_app
-from .models import ProjectSetupResult, SetupOptions
+from importlib import import_module
+from typing import Any
+
+# Exported name -> submodule that defines it, imported on first access
+_LAZY_EXPORTS = {
+    "ProjectSetupResult": ".models",
+    "SetupOptions": ".models",
+    "setup_app": ".app",
+    "setup_command": ".app",
+}
 
 __all__ = [
     "ProjectSetupResult",
     "SetupOptions",
-    "setup_app"
+    "setup_app",
+    "setup_command"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import setup models or build the setup app only when requested."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(name)
+    return getattr(import_module(module_name, __name__), name)
@@ -1,44 +1,61 @@
+from functools import cache
+from typing import Any
+
 from cyclopts import App
 
-from foodtruck_cli.commands.setup.command import (
-    setup_all_command,
-    setup_api_command,
-    setup_website_command,
-)
 
-setup_app = App(
-    name="setup", help="Setup the complete Food Truck development environment"
-)
+@cache
+def get_setup_app() -> App:
+    """Create the setup app and register its subcommands on first use.
+
+    The setup implementation (and the models it builds) is only
+    imported once a subcommand runs.
+    """
+    setup_app = App(
+        name="setup", help="Setup the complete Food Truck development environment"
+    )
+
+    @setup_app.command
+    def api(
+        api_repo: str = "https://github.com/foodtruck-project/foodtruck-api.git",
+        target_dir: str = ".",
+    ):
+        """Setup only the API project"""
+        from .command import setup_api_command
 
+        setup_api_command(api_repo, target_dir)
 
-@setup_app.command
-def api(
-    api_repo: str = "https://github.com/foodtruck-project/foodtruck-api.git",
-    target_dir: str = ".",
-):
-    """Setup only the API project"""
-    setup_api_command(api_repo, target_dir)
+    @setup_app.command
+    def website(
+        website_repo: str = "https://github.com/foodtruck-project/foodtruck-website.git",
+        target_dir: str = ".",
+    ):
+        """Setup only the website project"""
+        from .command import setup_website_command
 
+        setup_website_command(website_repo, target_dir)
 
-@setup_app.command
-def website(
-    website_repo: str = "https://github.com/foodtruck-project/foodtruck-website.git",
-    target_dir: str = ".",
-):
-    """Setup only the website project"""
-    setup_website_command(website_repo, target_dir)
+    @setup_app.command
+    def setup_all(
+        api_repo: str = "https://github.com/foodtruck-project/foodtruck-api.git",
+        website_repo: str = "https://github.com/foodtruck-project/foodtruck-website.git",
+        target_dir: str = ".",
+    ):
+        """Setup both API and website projects"""
+        from .command import setup_all_command
 
+        setup_all_command(api_repo, website_repo, target_dir)
 
-@setup_app.command
-def setup_all(
-    api_repo: str = "https://github.com/foodtruck-project/foodtruck-api.git",
-    website_repo: str = "https://github.com/foodtruck-project/foodtruck-website.git",
-    target_dir: str = ".",
-):
-    """Setup both API and website projects"""
-    setup_all_command(api_repo, website_repo, target_dir)
+    return setup_app
 
 
 def setup_command() -> None:
     """Setup the complete Food Truck development environment"""
-    setup_app()
+    get_setup_app()()
+
+
+def __getattr__(name: str) -> Any:
+    """Build the cyclopts setup app only when it is actually requested."""
+    if name == "setup_app":
+        return get_setup_app()
+    raise AttributeError(name)
@@ -1,47 +1,49 @@
+from dataclasses import dataclass
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
-
 from ...utils.fs import create_dir
 
 
-class ProjectSetupResult(BaseModel):
-    """Result of a project setup operation."""
-
-    success: bool = Field(description="Whether the setup was successful")
-    message: str = Field(default="", description="Optional error or info message")
-    project_path: Path | None = Field(
-        default=None, description="Path to the project if created"
-    )
-
-
-class SetupOptions(BaseModel):
-    """Configuration options for the Food Truck development environment setup."""
-
-    api_repo: str = Field(
-        default="https://github.com/foodtruck-project/foodtruck-api.git",
-        description="API repository URL",
-    )
-    website_repo: str = Field(
-        default="https://github.com/foodtruck-project/foodtruck-website.git",
-        description="Website repository URL",
-    )
-    target_dir: str = Field(
-        default="foodtruck-projects",
-        description="Target directory to clone repositories",
-    )
-    skip_api: bool = Field(default=False, description="Skip API repository setup")
-    skip_website: bool = Field(
-        default=False, description="Skip website repository setup"
-    )
-
-    @field_validator("target_dir")
-    @classmethod
-    def validate_target_dir(cls, value: str) -> str:
+@dataclass(slots=True, frozen=True)
+class ProjectSetupResult:
+    """Result of a project setup operation.
+
+    Attributes:
+        success: Whether the setup was successful
+        message: Optional error or info message
+        project_path: Path to the project if created
+    """
+
+    success: bool
+    message: str = ""
+    project_path: Path | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SetupOptions:
+    """Configuration options for the Food Truck development environment setup.
+
+    Values come straight from the already-parsed CLI arguments, so only the
+    target directory needs normalizing.
+
+    Attributes:
+        api_repo: API repository URL
+        website_repo: Website repository URL
+        target_dir: Target directory to clone repositories
+        skip_api: Skip API repository setup
+        skip_website: Skip website repository setup
+    """
+
+    api_repo: str = "https://github.com/foodtruck-project/foodtruck-api.git"
+    website_repo: str = "https://github.com/foodtruck-project/foodtruck-website.git"
+    target_dir: str = "foodtruck-projects"
+    skip_api: bool = False
+    skip_website: bool = False
+
+    def __post_init__(self) -> None:
         """Validate and normalize target directory path."""
-        if not value or value.strip() == "":
-            return "foodtruck-projects"
-        return value.strip()
+        target_dir = self.target_dir.strip() if self.target_dir else ""
+        object.__setattr__(self, "target_dir", target_dir or "foodtruck-projects")
 
     def get_target_path(self) -> Path:
         """Get the resolved target directory path."""
@@ -2,23 +2,24 @@
 Setup command for Food Truck CLI
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from foodtruck_cli.commands.setup.models import ProjectSetupResult, SetupOptions
 
 from ...utils.console import (
+    MessageType,
     print_info,
-    print_separator,
+    print_messages,
     print_setup_failure_message,
     print_setup_success_message,
     print_skip,
     print_step,
     print_success,
-    print_title,
 )
-from ...utils.fs import get_project_path, project_exists
+from ...utils.fs import get_project_path
 from ...utils.git import clone_repository
-from ...utils.run_command import run_command
+from ...utils.run_command import has_command, run_command
 
 
 def _install_api_dependencies(
@@ -27,8 +28,7 @@ def _install_api_dependencies(
     """Install project dependencies using UV."""
     print_step(f"Setting up {project_name} dependencies...")
 
-    result = run_command(["uv", "--version"], cwd=project_path)
-    if not result.success:
+    if not has_command("uv"):
         return ProjectSetupResult(
             success=False, message="UV is not available. Please install UV first."
         )
@@ -45,13 +45,17 @@ def _install_api_dependencies(
     )
 
 
-def _setup_project(
+def _clone_project(
     target_path: Path,
     project_name: str,
     repo_url: str,
     skip_flag: bool,
 ) -> ProjectSetupResult:
-    """Setup a single project (clone and optionally setup dependencies)."""
+    """Clone a single project unless it is skipped or already present.
+
+    project_path is only set on the result when a fresh clone was made, which
+    tells the caller the project still needs its dependencies installed.
+    """
 
     if skip_flag:
         print_skip(f"Skipping {project_name} setup")
@@ -61,46 +65,59 @@ def _setup_project(
 
     project_path = get_project_path(target_path, project_name)
 
-    if project_exists(target_path, project_name):
+    if project_path.exists():
         print_info(f"{project_name} directory already exists, skipping clone")
-        return ProjectSetupResult(success=True, project_path=project_path)
+        return ProjectSetupResult(
+            success=True, message=f"{project_name} directory already exists"
+        )
 
-    cloned = clone_repository(repo_url, project_path)
+    cloned = clone_repository(repo_url, project_path, already_checked=True)
 
     if not cloned:
         return ProjectSetupResult(
             success=False, message=f"Failed to clone {project_name}"
         )
 
-    if "api" in project_name.lower():
-        result = _install_api_dependencies(project_path, project_name)
-        if not result.success:
-            return result
-
     return ProjectSetupResult(success=True, project_path=project_path)
 
 
 def setup_environment(setup_options: SetupOptions) -> None:
     """Setup the complete Food Truck development environment."""
-    print_title("Food Truck Development Environment Setup")
-    print_separator()
-
     target_path = setup_options.get_target_path()
-    print_info(f"Target directory: {target_path}")
-
-    api_result = _setup_project(
-        target_path=target_path,
-        project_name="foodtruck-api",
-        repo_url=setup_options.api_repo,
-        skip_flag=not setup_options.should_setup_api(),
+    print_messages(
+        [
+            ("Food Truck Development Environment Setup", MessageType.TITLE),
+            ("=" * 50, MessageType.MUTED),
+            (f"Target directory: {target_path}", MessageType.INFO),
+        ]
     )
 
-    website_result = _setup_project(
-        target_path=target_path,
-        project_name="foodtruck-website",
-        repo_url=setup_options.website_repo,
-        skip_flag=not setup_options.should_setup_website(),
-    )
+    # The projects are independent clones in separate directories, so they are
+    # cloned side by side; the console serializes their output lines
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        api_future = executor.submit(
+            _clone_project,
+            target_path=target_path,
+            project_name="foodtruck-api",
+            repo_url=setup_options.api_repo,
+            skip_flag=not setup_options.should_setup_api(),
+        )
+        website_future = executor.submit(
+            _clone_project,
+            target_path=target_path,
+            project_name="foodtruck-website",
+            repo_url=setup_options.website_repo,
+            skip_flag=not setup_options.should_setup_website(),
+        )
+    api_result = api_future.result()
+    website_result = website_future.result()
+
+    # Dependencies are installed once the network-bound clones are done, and
+    # only for a freshly cloned API
+    if api_result.success and api_result.project_path is not None:
+        api_result = _install_api_dependencies(
+            api_result.project_path, "foodtruck-api"
+        )
 
     if api_result.success and website_result.success:
         print_setup_success_message(target_path)
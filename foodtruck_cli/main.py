@@ -3,32 +3,57 @@ Food Truck CLI - Main entry point
 """
 
 import sys
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-import cyclopts
+from . import __version__
 
-from .commands import api_app, check_command, completion_app, setup_app
-from .utils.console import print_error
+if TYPE_CHECKING:
+    import cyclopts
 
-# Create cyclopts app
-app = cyclopts.App(
-    name="foodtruck",
-    help="Food Truck Development CLI",
-    version="0.1.0",
-)
 
-# Register commands
-app.command(api_app, name="api")
-app.command(setup_app, name="setup")
-app.command(check_command, name="check")
-app.command(completion_app, name="completion")
+@cache
+def get_app() -> "cyclopts.App":
+    """Create the cyclopts app and register the command groups."""
+    import cyclopts
+
+    from .commands import api_app, check_command, completion_app, setup_app
+
+    # Create cyclopts app
+    app = cyclopts.App(
+        name="foodtruck",
+        help="Food Truck Development CLI",
+        version=__version__,
+    )
+
+    # Register commands
+    app.command(api_app, name="api")
+    app.command(setup_app, name="setup")
+    app.command(check_command, name="check")
+    app.command(completion_app, name="completion")
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """Keep the module-level app attribute available, built lazily."""
+    if name == "app":
+        return get_app()
+    raise AttributeError(name)
 
 
 def main() -> None:
     """Main CLI entry point."""
+    # Answer a bare --version without importing cyclopts, rich or any command
+    if sys.argv[1:] == ["--version"]:
+        print(__version__)
+        return
+
     try:
         # Parse and execute commands
-        app()
+        get_app()()
     except Exception as e:
+        from .utils.console import print_error
+
         print_error(f"Error: {e}")
         sys.exit(1)
 
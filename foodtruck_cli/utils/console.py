@@ -4,13 +4,15 @@ Provides consistent styling and output across all commands
 """
 
 import sys
+from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
-from rich.console import Console
-from rich.theme import Theme
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
 
 # Theme configuration
 THEME_CONFIG = {
@@ -28,21 +30,46 @@ THEME_CONFIG = {
     "dim": "dim white",
 }
 
-# Global console instance
-console = Console(theme=Theme(THEME_CONFIG))
 
+@cache
+def get_console() -> "Console":
+    """Get the shared console, importing rich on first use.
 
-class MessageStyle(BaseModel):
-    """Represents a message style with color and icon."""
+    Commands that never print (such as --version) skip rich entirely. Messages
+    carry their own styles and are printed verbatim, so rich's highlighter,
+    markup and emoji-code parsing are all turned off.
+    """
+    from rich.console import Console
+    from rich.theme import Theme
+
+    return Console(
+        theme=Theme(THEME_CONFIG), highlight=False, markup=False, emoji=False
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Keep the module-level console attribute available, created lazily."""
+    if name == "console":
+        return get_console()
+    raise AttributeError(name)
+
+
+@dataclass(slots=True, frozen=True)
+class MessageStyle:
+    """Represents a message style with color and icon.
+
+    Attributes:
+        style: Theme style name applied to the whole line
+        icon: Icon printed before the message
+        prefix: Text printed before the icon
+        suffix: Text printed after the message
+    """
 
     style: str
     icon: str = ""
     prefix: str = ""
     suffix: str = ""
 
-    class Config:
-        frozen = True
-
 
 class MessageType(Enum):
     """Message types with their styling configuration."""
@@ -73,6 +100,18 @@ class MessageType(Enum):
     HIGHLIGHT = MessageStyle(style="highlight")
 
 
+# (prefix + icon, suffix, style) of each message type, so printing a line is a
+# single dict lookup instead of unwrapping the enum member's style each time
+_STYLE_TABLE: dict[MessageType, tuple[str, str, str]] = {
+    msg_type: (
+        msg_type.value.prefix + msg_type.value.icon,
+        msg_type.value.suffix,
+        msg_type.value.style,
+    )
+    for msg_type in MessageType
+}
+
+
 def print_message(
     message: str,
     msg_type: MessageType,
@@ -89,12 +128,31 @@ def print_message(
         suffix: str | None = None,
         style_override: str | None = None,
     """
-    msg_style = msg_type.value
-    display_prefix = prefix if prefix is not None else msg_style.prefix + msg_style.icon
-    display_suffix = suffix if suffix is not None else msg_style.suffix
-    style = style_override if style_override is not None else msg_style.style
+    default_prefix, default_suffix, default_style = _STYLE_TABLE[msg_type]
+    display_prefix = prefix if prefix is not None else default_prefix
+    display_suffix = suffix if suffix is not None else default_suffix
+    style = style_override if style_override is not None else default_style
+
+    get_console().print(f"{display_prefix}{message}{display_suffix}", style=style)
+
+
+def print_messages(messages: list[tuple[str, MessageType]]) -> None:
+    """Print several styled messages with a single console call.
 
-    console.print(f"{display_prefix}{message}{display_suffix}", style=style)
+    Each line is rendered exactly as print_message would render it, but the
+    whole block is written in one pass instead of one write per line.
+
+    Args:
+        messages: (message, msg_type) pairs, printed one per line
+    """
+    from rich.console import Group
+
+    console = get_console()
+    lines: list[Text] = []
+    for message, msg_type in messages:
+        prefix, suffix, style = _STYLE_TABLE[msg_type]
+        lines.append(console.render_str(f"{prefix}{message}{suffix}", style=style))
+    console.print(Group(*lines))
 
 
 def print_success(message: str) -> None:
@@ -164,7 +222,7 @@ def print_separator(char: str = "=", length: int = 50) -> None:
 
 def print_newline() -> None:
     """Print a newline."""
-    console.print()
+    get_console().print()
 
 
 def print_list(
@@ -207,35 +265,45 @@ def print_formatted(content: Any, style: str | None = None) -> None:
         style: Optional custom style to apply
     """
     if style:
-        console.print(content, style=style)
+        get_console().print(content, style=style)
     else:
-        console.print(content)
+        get_console().print(content)
 
 
 def print_setup_success_message(target_path: Path) -> None:
     """Print success message and next steps."""
-    print_newline()
-    print_success("Setup completed successfully!")
-    print_newline()
-    print_info(f"Projects created in: {target_path}")
-    print_newline()
-    print_subtitle("Next steps:")
-    print_command(
-        "  API: cd foodtruck-api && uv run python -m foodtruck_api.cli.app database init"
+    print_messages(
+        [
+            ("", MessageType.MUTED),
+            ("Setup completed successfully!", MessageType.SUCCESS),
+            ("", MessageType.MUTED),
+            (f"Projects created in: {target_path}", MessageType.INFO),
+            ("", MessageType.MUTED),
+            ("Next steps:", MessageType.SUBTITLE),
+            (
+                "  API: cd foodtruck-api && uv run python -m foodtruck_api.cli.app database init",
+                MessageType.COMMAND,
+            ),
+            (
+                "  Website: cd foodtruck-website && open index.html",
+                MessageType.COMMAND,
+            ),
+        ]
     )
-    print_command("  Website: cd foodtruck-website && open index.html")
 
 
 def print_setup_failure_message(
     api_result: Any, website_result: Any
 ) -> None:
     """Print failure message with details."""
-    print_newline()
-    print_error("Setup failed. Please check the errors above.")
-
+    messages = [
+        ("", MessageType.MUTED),
+        ("Setup failed. Please check the errors above.", MessageType.ERROR),
+    ]
     if not api_result.success and api_result.message:
-        print_error(f"API: {api_result.message}")
+        messages.append((f"API: {api_result.message}", MessageType.ERROR))
     if not website_result.success and website_result.message:
-        print_error(f"Website: {website_result.message}")
+        messages.append((f"Website: {website_result.message}", MessageType.ERROR))
+    print_messages(messages)
 
     sys.exit(1)
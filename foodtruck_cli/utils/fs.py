@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -15,11 +16,7 @@ def ensure_project_dir(base_path: Path, project_name: str) -> Path:
     return project_path
 
 
-def project_exists(base_path: Path, project_name: str) -> bool:
-    """Check if project directory already exists."""
-    return (base_path / project_name).exists()
-
-
+@lru_cache(maxsize=256)
 def get_project_path(base_path: Path, project_name: str) -> Path:
-    """Get the full path for a project directory."""
+    """Get the full path for a project directory, memoized per process."""
     return base_path / project_name
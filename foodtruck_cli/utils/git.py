@@ -1,18 +1,55 @@
+import re
 from pathlib import Path
 
 from .console import print_clone, print_warning
 from .run_command import run_command
 
+# Errors from servers or transports that cannot serve shallow clones
+_UNSUPPORTED_CLONE_RE = re.compile(r"shallow", re.IGNORECASE)
 
-def clone_repository(repo_url: str, target_path: Path) -> bool:
-    """Clone a repository."""
+
+def clone_repository(
+    repo_url: str,
+    target_path: Path,
+    already_checked: bool = False,
+    depth: int | None = 1,
+) -> bool:
+    """Clone a repository.
+
+    By default only the tip of the default branch is fetched, which is all a
+    fresh workspace needs. Pass depth=None for a full clone with complete
+    history. No partial-clone filter is used: it would make later checkouts
+    and diffs fetch missing objects from the network on demand.
+
+    Args:
+        repo_url: URL of the repository to clone
+        target_path: Directory to clone into
+        already_checked: The caller has just verified target_path does not exist
+        depth: Number of commits to fetch, or None for the full history
+    """
     print_clone(f"Cloning {repo_url}...")
 
-    if target_path.exists():
+    if not already_checked and target_path.exists():
         print_warning(f"Directory {target_path} already exists. Skipping clone.")
-        return None
+        return False
+
+    options = []
+    if depth is not None:
+        options += [f"--depth={depth}", "--single-branch"]
+
+    result = run_command(
+        ["git", "clone", *options, repo_url, str(target_path)],
+        print_output=True,
+    )
+    if result.success or not options:
+        return result.success
+    if not _UNSUPPORTED_CLONE_RE.search(result.stderr):
+        return False
 
+    # The server cannot serve a shallow clone; fetch everything instead
+    print_warning("Shallow clone not supported by the server, retrying full clone")
     result = run_command(
-        ["git", "clone", repo_url, str(target_path)], print_output=True
+        ["git", "clone", repo_url, str(target_path)],
+        print_output=True,
     )
     return result.success
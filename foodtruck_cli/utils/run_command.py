@@ -1,8 +1,43 @@
+import asyncio
+import shutil
 import subprocess
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable, Coroutine
+from functools import cache
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
-from .console import print_error, print_success
+from .console import MessageType, print_error, print_message, print_success
+
+# Lines of streamed output kept for the returned CommandResult
+STREAM_TAIL_LINES = 200
+
+# Trailing lines of streamed output reported as the error message on failure
+STREAM_ERROR_LINES = 5
+
+
+def _popen_kwargs() -> dict[str, Any]:
+    """Extra process creation options for the current platform.
+
+    On Windows, hide the console window a GUI-launched CLI would otherwise
+    flash for every child. Only applied to children whose stdout and stderr
+    are piped: a windowless child writing to inherited console handles would
+    have no console, and its output would be lost. Other platforms keep the
+    subprocess defaults.
+    """
+    if not sys.platform.startswith("win"):
+        return {}
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return {
+        "startupinfo": startupinfo,
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+    }
+
+
+_POPEN_KWARGS = _popen_kwargs()
 
 
 class CommandResult(NamedTuple):
@@ -14,14 +49,106 @@ class CommandResult(NamedTuple):
     returncode: int
 
 
+@cache
+def find_executable(name: str) -> str | None:
+    """Resolve an executable on PATH once per process, or None if missing."""
+    return shutil.which(name)
+
+
+def has_command(name: str) -> bool:
+    """Check whether an executable is available on PATH.
+
+    Uses the cached PATH lookup without spawning anything, so it is a cheap
+    replacement for probing a tool with `<tool> --version`.
+    """
+    return find_executable(name) is not None
+
+
+def _resolve_executable(cmd: list[str]) -> list[str]:
+    """Replace a bare program name with its absolute path on PATH.
+
+    subprocess can only take its posix_spawn fast path, which avoids fork()
+    and its page-table copy, when the executable is given with a directory.
+    A missing tool keeps its bare name so it still surfaces through the usual
+    "not found" error when it is run.
+    """
+    if Path(cmd[0]).name != cmd[0]:
+        return cmd
+    return [find_executable(cmd[0]) or cmd[0], *cmd[1:]]
+
+
+def _decode(data: bytes | None) -> str:
+    """Decode captured process output as UTF-8 and strip surrounding whitespace.
+
+    Decoding explicitly avoids the locale codec lookup text mode would do.
+    """
+    return data.decode("utf-8", "replace").strip() if data else ""
+
+
+def _stream_command(
+    cmd: list[str], cwd: Path | None, timeout: int | None
+) -> subprocess.CompletedProcess[bytes]:
+    """Run a command, echoing its combined output line by line as it arrives.
+
+    Only the last STREAM_TAIL_LINES non-empty lines are kept and returned as
+    stdout, so memory stays bounded no matter how much the command prints;
+    the last STREAM_ERROR_LINES become the error message on failure. Raises
+    the same CalledProcessError and TimeoutExpired as subprocess.run.
+    """
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        **_POPEN_KWARGS,
+    )
+    assert process.stdout is not None
+    expired = threading.Event()
+
+    def expire() -> None:
+        expired.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, expire) if timeout is not None else None
+    tail: deque[bytes] = deque(maxlen=STREAM_TAIL_LINES)
+    with process:
+        if timer is not None:
+            timer.start()
+        try:
+            for raw_line in process.stdout:
+                line = _decode(raw_line)
+                if line:
+                    print_message(line, MessageType.MUTED)
+                    tail.append(raw_line)
+            returncode = process.wait()
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    if expired.is_set() and timeout is not None:
+        raise subprocess.TimeoutExpired(cmd, float(timeout))
+    if returncode:
+        error_lines = list(tail)[-STREAM_ERROR_LINES:]
+        raise subprocess.CalledProcessError(
+            returncode, cmd, stderr=b"".join(error_lines)
+        )
+    return subprocess.CompletedProcess(
+        cmd, returncode, stdout=b"".join(tail), stderr=b""
+    )
+
+
 def run_command(
     cmd: list[str],
     cwd: Path | None = None,
-    timeout: int = 300,
+    timeout: int | None = 300,
     capture_output: bool = True,
     print_output: bool = False,
 ) -> CommandResult:
-    """Execute a shell command and return comprehensive result."""
+    """Execute a shell command and return comprehensive result.
+
+    With print_output and capture_output both set, output is streamed to the
+    console while the command runs instead of being printed once it exits.
+    """
     if not cmd:
         error_msg = "No command provided"
         if print_output:
@@ -29,28 +156,28 @@ def run_command(
         return CommandResult(False, "", error_msg, -1)
 
     error_msg = ""
+    streamed = print_output and capture_output
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=capture_output,
-            text=True,
-            check=True,
-            timeout=timeout,
-        )
-        if print_output and result.stdout and result.stdout.strip():
-            print_success(result.stdout.strip())
+        if streamed:
+            result = _stream_command(_resolve_executable(cmd), cwd, timeout)
+        else:
+            result = subprocess.run(
+                _resolve_executable(cmd),
+                cwd=cwd,
+                capture_output=capture_output,
+                check=True,
+                timeout=timeout,
+                **(_POPEN_KWARGS if capture_output else {}),
+            )
+        stdout_text = _decode(result.stdout)
+        if print_output and stdout_text and not streamed:
+            print_success(stdout_text)
         return CommandResult(
-            True,
-            result.stdout.strip() if result.stdout else "",
-            result.stderr.strip() if result.stderr else "",
-            result.returncode,
+            True, stdout_text, _decode(result.stderr), result.returncode
         )
     except subprocess.CalledProcessError as e:
         error_msg = (
-            e.stderr.strip()
-            if e.stderr
-            else f"Command failed with exit code {e.returncode}"
+            _decode(e.stderr) or f"Command failed with exit code {e.returncode}"
         )
     except (FileNotFoundError, PermissionError) as e:
         if isinstance(e, FileNotFoundError):
@@ -65,3 +192,75 @@ def run_command(
     if print_output and error_msg:
         print_error(error_msg)
     return CommandResult(False, "", error_msg, -1)
+
+
+@cache
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory when the optional extra is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is available."""
+    return asyncio.run(coro, loop_factory=_loop_factory())
+
+
+async def run_command_async(
+    cmd: list[str],
+    cwd: Path | None = None,
+    timeout: int | None = 300,
+    print_output: bool = False,
+) -> CommandResult:
+    """Execute a command on the asyncio loop and return comprehensive result.
+
+    Behaves like run_command with captured output, but lets several commands
+    run concurrently under asyncio.gather without a thread per command.
+    """
+    if not cmd:
+        error_msg = "No command provided"
+        if print_output:
+            print_error(error_msg)
+        return CommandResult(False, "", error_msg, -1)
+
+    error_msg = ""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *_resolve_executable(cmd),
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **_POPEN_KWARGS,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+        stdout_text = _decode(stdout)
+        stderr_text = _decode(stderr)
+        if process.returncode == 0:
+            if print_output and stdout_text:
+                print_success(stdout_text)
+            return CommandResult(True, stdout_text, stderr_text, 0)
+        error_msg = (
+            stderr_text or f"Command failed with exit code {process.returncode}"
+        )
+    except (FileNotFoundError, PermissionError) as e:
+        if isinstance(e, FileNotFoundError):
+            error_msg = f"Command '{cmd[0]}' not found. Please ensure it's installed and in your PATH"
+        else:
+            error_msg = f"Permission denied when running '{' '.join(cmd)}'"
+    except TimeoutError:
+        error_msg = f"Command '{' '.join(cmd)}' timed out after {timeout} seconds"
+    except Exception as e:
+        error_msg = f"Unexpected error: {e!s}"
+
+    if print_output and error_msg:
+        print_error(error_msg)
+    return CommandResult(False, "", error_msg, -1)
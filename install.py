@@ -6,72 +6,130 @@ Replaces the functionality of install.sh
 
 import os
 import platform
-import shutil
-import subprocess
 import sys
-import tarfile
-import urllib.request
-import zipfile
+import threading
+from functools import cache
 from pathlib import Path
 
+# Directory where this script is located, resolved once
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Fence lines around the PATH block written to the shell configuration
+PATH_BLOCK_START = "# >>> foodtruck-cli path >>>"
+PATH_BLOCK_END = "# <<< foodtruck-cli path <<<"
+
+# Read size used when buffering the carapace-bin download
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@cache
+def _system() -> str:
+    """Name of the operating system, looked up once per run"""
+    return platform.system()
+
+
+@cache
+def _is_windows() -> bool:
+    """Whether the installer is running on Windows"""
+    return _system() == "Windows"
+
+
+@cache
+def _home() -> Path:
+    """Home directory of the current user, looked up once per run"""
+    return Path.home()
+
+
+# Serializes output from the install steps that run concurrently
+_PRINT_LOCK = threading.Lock()
+
+
+def _print(text: str) -> None:
+    """Print a whole line without interleaving with other threads"""
+    with _PRINT_LOCK:
+        print(text)
+
 
 def print_success(text: str) -> None:
     """Print success message"""
-    print(f"\033[0;32m✅ {text}\033[0m")
+    _print(f"\033[0;32m✅ {text}\033[0m")
 
 
 def print_error(text: str) -> None:
     """Print error message"""
-    print(f"\033[0;31m❌ {text}\033[0m")
+    _print(f"\033[0;31m❌ {text}\033[0m")
 
 
 def print_warning(text: str) -> None:
     """Print warning message"""
-    print(f"\033[1;33m⚠️  {text}\033[0m")
+    _print(f"\033[1;33m⚠️  {text}\033[0m")
 
 
 def print_info(text: str) -> None:
     """Print info message"""
-    print(f"\033[0;34mi  {text}\033[0m")
+    _print(f"\033[0;34mi  {text}\033[0m")
 
 
 def print_step(text: str) -> None:
     """Print step message"""
-    print(f"\033[0;34m🔧 {text}\033[0m")
+    _print(f"\033[0;34m🔧 {text}\033[0m")
 
 
 def print_title(text: str) -> None:
     """Print title message"""
-    print(f"\033[0;34m🚚 {text}\033[0m")
+    _print(f"\033[0;34m🚚 {text}\033[0m")
+
 
+@cache
+def find_uv() -> str | None:
+    """Resolve the full path of the UV executable once per run"""
+    import shutil
 
-def get_script_dir() -> Path:
-    """Get the directory where this script is located"""
-    return Path(__file__).parent.absolute()
+    return shutil.which("uv")
 
 
 def check_uv_installed() -> bool:
     """Check if UV is installed and available in PATH"""
-    return shutil.which("uv") is not None
+    return find_uv() is not None
+
+
+def get_tool_bin_dir() -> Path:
+    """Get the directory where `uv tool install` places entry points"""
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            [find_uv() or "uv", "tool", "dir", "--bin"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return Path(result.stdout.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        # uv's default location on every platform
+        return _home() / ".local" / "bin"
 
 
 def create_wrapper_script(script_dir: Path) -> None:
-    """Create a wrapper script for the CLI"""
+    """Create a wrapper script for the CLI
+
+    The wrapper calls the entry point installed by `uv tool install`
+    directly, so each invocation skips the `uv run` environment sync.
+    """
     wrapper_script = script_dir / "foodtruck"
+    bin_dir = get_tool_bin_dir()
 
-    if platform.system() == "Windows":
+    if _is_windows():
         # Windows batch file
         wrapper_content = f"""@echo off
-cd /d "{script_dir}"
-uv run foodtruck %*
+"{bin_dir / "foodtruck.exe"}" %*
 """
         wrapper_script = wrapper_script.with_suffix(".bat")
     else:
         # Unix shell script
-        wrapper_content = """#!/bin/bash
+        wrapper_content = f"""#!/bin/bash
 # Wrapper script for foodtruck CLI
-cd "$(dirname "$0")"
-uv run foodtruck "$@"
+exec "{bin_dir / "foodtruck"}" "$@"
 """
 
     # Check if wrapper script already exists
@@ -84,7 +142,7 @@ uv run foodtruck "$@"
             f.write(wrapper_content)
 
         # Make executable on Unix systems
-        if platform.system() != "Windows":
+        if not _is_windows():
             wrapper_script.chmod(0o755)
 
         print_success("Script wrapper criado")
@@ -96,16 +154,17 @@ uv run foodtruck "$@"
         sys.exit(1)
 
 
+@cache
 def detect_shell() -> tuple[str | None, Path | None]:
-    """Detect the current shell and its configuration file"""
+    """Detect the current shell and its configuration file (once per run)"""
     shell = os.environ.get("SHELL", "")
-    home = Path.home()
+    home = _home()
 
     if "zsh" in shell:
         return "zsh", home / ".zshrc"
     if "bash" in shell:
         return "bash", home / ".bashrc"
-    if platform.system() == "Windows":
+    if _is_windows():
         # On Windows, we'll use PowerShell profile
         powershell_profile = (
             home
@@ -118,43 +177,45 @@ def detect_shell() -> tuple[str | None, Path | None]:
 
 
 def add_to_path(script_dir: Path, shell_config: Path, shell_name: str) -> None:
-    """Add the script directory to PATH in shell configuration"""
-    if not shell_config.exists():
-        # Create the directory if it doesn't exist (for PowerShell on Windows)
-        shell_config.parent.mkdir(parents=True, exist_ok=True)
-        shell_config.touch()
-
-    # Read existing content
-    try:
-        with shell_config.open(encoding="utf-8") as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        # Try with different encoding
-        with shell_config.open(encoding="latin-1") as f:
-            content = f.read()
-
-    # Check if already configured
-    path_entry = str(script_dir)
-    if path_entry in content:
-        print_warning(f"PATH já configurado em {shell_config}")
-        return
-
-    # Add to configuration
-    with shell_config.open("a", encoding="utf-8") as f:
-        f.write("\n# Food Truck CLI\n")
-        if platform.system() == "Windows" and shell_name == "powershell":
-            f.write(f'$env:PATH = "{script_dir};" + $env:PATH\n')
+    """Add the script directory to PATH in shell configuration
+
+    The block is fenced by PATH_BLOCK_START / PATH_BLOCK_END so it can be
+    found line by line, without reading the whole file into memory.
+    """
+    # Create the directory if it doesn't exist (for PowerShell on Windows)
+    shell_config.parent.mkdir(parents=True, exist_ok=True)
+
+    path_entry = os.fspath(script_dir)
+    fence = PATH_BLOCK_START.encode()
+    # Configs written before the fence existed only contain the path itself
+    legacy_entry = path_entry.encode()
+
+    # One open both creates a missing file, scans it and appends to it
+    with shell_config.open("a+b") as f:
+        f.seek(0)
+        # Check if already configured
+        for existing in f:
+            if existing.startswith(fence) or legacy_entry in existing:
+                print_warning(f"PATH já configurado em {shell_config}")
+                return
+
+        # Add to configuration
+        if _is_windows() and shell_name == "powershell":
+            line = f'$env:PATH = "{path_entry};" + $env:PATH\n'
         else:
-            f.write(f'export PATH="{script_dir}:$PATH"\n')
+            line = f'export PATH="{path_entry}:$PATH"\n'
+        f.write(f"\n{PATH_BLOCK_START}\n{line}{PATH_BLOCK_END}\n".encode())
 
     print_success(f"Adicionado ao {shell_config}")
 
 
 def install_package() -> None:
-    """Install the package using UV"""
+    """Install the package as a uv tool with its own environment"""
+    import subprocess
+
     try:
         subprocess.run(
-            ["uv", "pip", "install", "-e", "."],
+            [find_uv() or "uv", "tool", "install", "--force", "--editable", "."],
             capture_output=True,
             text=True,
             check=True,
@@ -172,76 +233,86 @@ def get_carapace_download_url() -> str:
     """Get the appropriate carapace-bin download URL for the current platform"""
     version = "1.4.1"
 
-    if platform.system() == "Windows":
+    if _is_windows():
         return f"https://github.com/carapace-sh/carapace-bin/releases/download/v{version}/carapace-bin_{version}_windows_amd64.zip"
-    if platform.system() == "Darwin":  # macOS
+    if _system() == "Darwin":  # macOS
         return f"https://github.com/carapace-sh/carapace-bin/releases/download/v{version}/carapace-bin_{version}_darwin_amd64.tar.gz"
     # For Linux and other Unix-like systems
     return f"https://github.com/carapace-sh/carapace-bin/releases/download/v{version}/carapace-bin_{version}_linux_386.tar.gz"
 
 
-def download_carapace(script_dir: Path) -> Path:
-    """Download and extract carapace-bin"""
-    url = get_carapace_download_url()
-    filename = url.split("/")[-1]
-    download_path = script_dir / filename
-
-    # Check if the download file already exists
-    if download_path.exists():
-        print_warning(f"Arquivo já existe: {download_path}")
-        print_step("Usando arquivo existente...")
-    else:
-        print_step(f"Baixando carapace-bin: {filename}")
-        try:
-            # Download the file
-            urllib.request.urlretrieve(url, download_path)
-            print_success(f"Download concluído: {download_path}")
-        except Exception as e:
-            print_error(f"Erro ao baixar carapace-bin: {e}")
-            sys.exit(1)
+def _find_carapace_exe(root: Path) -> Path | None:
+    """Find the carapace executable in an extracted carapace-bin tree
 
-    try:
-        # Extract the file
-        extract_dir = script_dir / "carapace-bin"
-        extract_dir.mkdir(exist_ok=True)
-
-        if filename.endswith(".zip"):
-            # Windows zip file
-            with zipfile.ZipFile(download_path, "r") as zip_ref:
-                zip_ref.extractall(extract_dir)
-        else:
-            # Linux tar.gz file
-            with tarfile.open(download_path, "r:gz") as tar_ref:
-                tar_ref.extractall(extract_dir)
+    Release archives put the binary at the top level, so that is probed
+    directly before falling back to a name-filtered walk.
+    """
+    for candidate in (root / "carapace", root / "carapace.exe"):
+        if candidate.is_file():
+            return candidate
+    return next(
+        (
+            file
+            for file in root.rglob("carapace*")
+            if file.name in {"carapace", "carapace.exe"} and file.is_file()
+        ),
+        None,
+    )
 
-        print_success(f"Carapace-bin extraído para: {extract_dir}")
 
-        # Clean up the downloaded file
-        download_path.unlink()
-        print_success("Arquivo de download removido")
+def download_carapace(script_dir: Path) -> Path:
+    """Download and extract carapace-bin
 
-        # Find the carapace executable
-        carapace_exe = None
-        for file in extract_dir.rglob("*"):
-            if file.is_file() and file.name in {"carapace", "carapace.exe"}:
-                carapace_exe = file
-                break
+    The archive is extracted straight from the HTTP response, so it is never
+    written to disk as a separate file.
+    """
+    import io
+    import shutil
+    import tarfile
+    import urllib.request
+    import zipfile
 
-        if carapace_exe:
-            # Make executable on Unix systems
-            if platform.system() != "Windows":
-                carapace_exe.chmod(0o755)
-            print_success(f"Carapace-bin instalado: {carapace_exe}")
-            return carapace_exe
-        print_error("Executável carapace não encontrado no arquivo extraído")
-        sys.exit(1)
+    url = get_carapace_download_url()
+    filename = url.split("/")[-1]
+    extract_dir = script_dir / "carapace-bin"
+    # Extract next to the final directory and move it into place only once the
+    # whole archive is in, so a broken download never looks installed
+    staging_dir = script_dir / "carapace-bin.tmp"
 
+    print_step(f"Baixando carapace-bin: {filename}")
+    try:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir()
+        with urllib.request.urlopen(url) as response:
+            if filename.endswith(".zip"):
+                # Windows zip file; zip needs random access, so buffer it
+                buffer = io.BytesIO()
+                shutil.copyfileobj(response, buffer, DOWNLOAD_CHUNK_SIZE)
+                with zipfile.ZipFile(buffer) as zip_ref:
+                    zip_ref.extractall(staging_dir)
+            else:
+                # Linux tar.gz file, extracted while it downloads
+                with tarfile.open(fileobj=response, mode="r|gz") as tar_ref:
+                    tar_ref.extractall(staging_dir)
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        staging_dir.replace(extract_dir)
     except Exception as e:
-        print_error(f"Erro ao extrair carapace-bin: {e}")
-        if download_path.exists():
-            download_path.unlink()
+        print_error(f"Erro ao baixar carapace-bin: {e}")
+        shutil.rmtree(staging_dir, ignore_errors=True)
         sys.exit(1)
 
+    print_success(f"Carapace-bin extraído para: {extract_dir}")
+
+    carapace_exe = _find_carapace_exe(extract_dir)
+    if carapace_exe:
+        # Make executable on Unix systems
+        if not _is_windows():
+            carapace_exe.chmod(0o755)
+        print_success(f"Carapace-bin instalado: {carapace_exe}")
+        return carapace_exe
+    print_error("Executável carapace não encontrado no arquivo extraído")
+    sys.exit(1)
+
 
 def install_carapace(script_dir: Path) -> None:
     """Install carapace-bin if not already present"""
@@ -249,12 +320,7 @@ def install_carapace(script_dir: Path) -> None:
 
     # Check if carapace is already installed
     if carapace_dir.exists():
-        carapace_exe = None
-        for file in carapace_dir.rglob("*"):
-            if file.is_file() and file.name in {"carapace", "carapace.exe"}:
-                carapace_exe = file
-                break
-
+        carapace_exe = _find_carapace_exe(carapace_dir)
         if carapace_exe:
             print_warning(f"Carapace-bin já instalado: {carapace_exe}")
             return
@@ -268,10 +334,11 @@ def install_carapace(script_dir: Path) -> None:
 
 def main():
     """Main installation function"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     print_title("Configurando Food Truck CLI...")
 
-    # Get script directory
-    script_dir = get_script_dir()
+    script_dir = SCRIPT_DIR
 
     # Check if UV is installed
     if not check_uv_installed():
@@ -293,32 +360,36 @@ def main():
         print_warning(
             "Shell não detectado. Adicione manualmente ao seu arquivo de configuração:"
         )
-        if platform.system() == "Windows":
+        if _is_windows():
             print(f'$env:PATH = "{script_dir};" + $env:PATH')
         else:
             print(f'export PATH="{script_dir}:$PATH"')
 
-    # Install the package
-    print_step("Instalando pacote...")
-    install_package()
-
-    # Install carapace-bin
-    print_step("Instalando carapace-bin...")
-    install_carapace(script_dir)
+    # The package install and the carapace-bin download are independent
+    # network-bound steps, so they run side by side
+    print_step("Instalando pacote e carapace-bin...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(install_package),
+            executor.submit(install_carapace, script_dir),
+        ]
+        for future in as_completed(futures):
+            # Re-raises the SystemExit of a failed step
+            future.result()
 
     # Success message
     print_success("Instalação concluída!")
 
     if shell_config:
         print_warning("💡 Recarregue seu terminal ou execute:")
-        if platform.system() == "Windows" and shell_name == "powershell":
+        if _is_windows() and shell_name == "powershell":
             print(f". {shell_config}")
         else:
             print(f"source {shell_config}")
 
     print()
     print_success("🚀 Use o CLI com:")
-    if platform.system() == "Windows":
+    if _is_windows():
         print("foodtruck.bat")
     else:
         print("foodtruck")
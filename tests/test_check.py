@@ -0,0 +1,44 @@
+"""Tests for the dependency check command."""
+
+import asyncio
+
+import pytest
+
+from foodtruck_cli.commands.check import check as check_mod
+from foodtruck_cli.commands.check.models import DependencyStatus
+
+
+@pytest.mark.unit
+def test_results_keep_their_fields_when_checks_finish_out_of_order(
+    monkeypatch, tmp_path
+):
+    """Each status lands in its own field whatever order the checks finish in."""
+    finished: list[str] = []
+
+    def fake_check(name: str, delay: float):
+        async def check() -> DependencyStatus:
+            await asyncio.sleep(delay)
+            finished.append(name)
+            return DependencyStatus(True, f"{name} ok")
+
+        return check
+
+    # Reverse of the declared order: docker finishes first, uv last
+    monkeypatch.setattr(check_mod, "check_uv", fake_check("uv", 0.03))
+    monkeypatch.setattr(check_mod, "check_git", fake_check("git", 0.02))
+    monkeypatch.setattr(check_mod, "check_docker", fake_check("docker", 0.0))
+    monkeypatch.setattr(check_mod, "CACHE_FILE", tmp_path / "check.json")
+
+    result = check_mod.perform_dependency_checks(refresh=True)
+
+    assert finished == ["docker", "git", "uv"]
+    assert result.python == check_mod.check_python_version()
+    assert result.uv == DependencyStatus(True, "uv ok")
+    assert result.git == DependencyStatus(True, "git ok")
+    assert result.docker == DependencyStatus(True, "docker ok")
+    assert [label for label, _ in result.iter_labeled()] == [
+        "Python 3.13",
+        "UV",
+        "Git",
+        "Docker",
+    ]